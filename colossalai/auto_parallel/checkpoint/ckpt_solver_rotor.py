@@ -1,4 +1,5 @@
 from copy import deepcopy
+from itertools import chain as chain_iter
 from typing import Any, Dict, List, Tuple
 
 from torch import Tensor
@@ -233,35 +234,48 @@ class CheckpointSolverRotor(CheckpointSolverBase):
                 else:
                     cost_table[m][i][i] = float("inf")
 
+        inf = float("inf")
+        # prefix sums so that sum(ftime[i:j]) becomes ftime_prefix[j] - ftime_prefix[i]
+        ftime_prefix = [0.0] * (len(ftime) + 1)
+        for k, v in enumerate(ftime):
+            ftime_prefix[k + 1] = ftime_prefix[k] + v
+
         # Compute tables
         for m in range(mmax + 1):
+            cost_m = cost_table[m]
+            back_m = back_ptr[m]
             for d in range(1, len(chain) + 1):
                 for i in range(len(chain) + 1 - d):
                     idx = i + d
-                    mmin = x[idx + 1] + x[i + 1] + ftmp[i]
+                    x_idx1 = x[idx + 1]
+                    mmin = x_idx1 + x[i + 1] + ftmp[i]
                     if idx > i + 1:
-                        mmin = max(mmin, x[idx + 1] + max(x[j] + x[j + 1] + ftmp[j] for j in range(i + 1, idx)))
+                        mmin = max(mmin, x_idx1 + max(x[j] + x[j + 1] + ftmp[j] for j in range(i + 1, idx)))
+                    cost_i = cost_m[i]
                     if m < mmin:
-                        cost_table[m][i][idx] = float("inf")
+                        cost_i[idx] = inf
                     else:
-                        leaf_checkpoints = [(j,
-                                             sum(ftime[i:j]) + cost_table[m - x[j]][j][idx] + cost_table[m][i][j - 1])
-                                            for j in range(i + 1, idx + 1)
-                                            if m >= x[j]]
-                        if leaf_checkpoints:
-                            best_leaf = min(leaf_checkpoints, key=lambda t: t[1])
-                        else:
-                            best_leaf = None
-                        if m >= xbar[i + 1]:
-                            chain_checkpoint = cost_table[m][i][i] + cost_table[m - xbar[i + 1]][i + 1][idx]
+                        ftime_prefix_i = ftime_prefix[i]
+                        best_cost = inf
+                        best_leaf = -1
+                        for j in range(i + 1, idx + 1):
+                            x_j = x[j]
+                            if m >= x_j:
+                                cost = ftime_prefix[j] - ftime_prefix_i + cost_table[m - x_j][j][idx] + cost_i[j - 1]
+                                if cost < best_cost:
+                                    best_cost = cost
+                                    best_leaf = j
+                        xbar_i1 = xbar[i + 1]
+                        if m >= xbar_i1:
+                            chain_checkpoint = cost_i[i] + cost_table[m - xbar_i1][i + 1][idx]
                         else:
-                            chain_checkpoint = float("inf")
-                        if best_leaf and best_leaf[1] <= chain_checkpoint:
-                            cost_table[m][i][idx] = best_leaf[1]
-                            back_ptr[m][i][idx] = (False, best_leaf[0])
+                            chain_checkpoint = inf
+                        if best_leaf >= 0 and best_cost <= chain_checkpoint:
+                            cost_i[idx] = best_cost
+                            back_m[i][idx] = (False, best_leaf)
                         else:
-                            cost_table[m][i][idx] = chain_checkpoint
-                            back_ptr[m][i][idx] = (True,)
+                            cost_i[idx] = chain_checkpoint
+                            back_m[i][idx] = (True,)
         return cost_table, back_ptr
 
     @staticmethod
@@ -352,20 +366,24 @@ class CheckpointSolverRotor(CheckpointSolverBase):
             node_list (List[List[Node]]): The list of nodes to annotate.
         """
         op_list = sequence.list_operations()
-        loss_op = next(op for op in op_list if isinstance(op, Loss))
-        fwd_list = op_list[:op_list.index(loss_op)]
-        bwd_list = op_list[op_list.index(loss_op) + 1:]
+        # resolve the position of the loss in one scan instead of searching the
+        # operation and then calling list.index on it twice
+        loss_idx = next(i for i, op in enumerate(op_list) if type(op) is Loss)
+        fwd_list = op_list[:loss_idx]
+        bwd_list = op_list[loss_idx + 1:]
         ckpt_idx = 0
         in_ckpt = False
         ckpt_region = []
 
-        # forward annotation
+        # forward annotation; the op classes have no further subclasses, so a
+        # single type() identity check replaces each isinstance dispatch
         for idx, op in enumerate(fwd_list, 0):
+            op_type = type(op)
             if in_ckpt:
-                if isinstance(op, ForwardNograd):
+                if op_type is ForwardNograd:
                     ckpt_region.append(idx)
 
-                elif isinstance(op, ForwardEnable):
+                elif op_type is ForwardEnable:
                     in_ckpt = False
                     for node_idx in ckpt_region:
                         for n in node_list[node_idx]:
@@ -374,7 +392,7 @@ class CheckpointSolverRotor(CheckpointSolverBase):
                     ckpt_idx += 1
                     ckpt_region = []
 
-                elif isinstance(op, ForwardCheck):
+                elif op_type is ForwardCheck:
                     for node_idx in ckpt_region:
                         for n in node_list[node_idx]:
                             n.meta['activation_checkpoint'] = [ckpt_idx]
@@ -383,18 +401,19 @@ class CheckpointSolverRotor(CheckpointSolverBase):
                     ckpt_region = [idx]
 
             else:
-                if isinstance(op, ForwardCheck):
+                if op_type is ForwardCheck:
                     in_ckpt = True
                     ckpt_region.append(idx)
 
         # annotate the backward if there is any nested activation checkpoint
         in_recompute = False
         for op in bwd_list:
+            op_type = type(op)
             if in_recompute:
-                if isinstance(op, ForwardNograd):
+                if op_type is ForwardNograd:
                     ckpt_region.append(op.index)
 
-                elif isinstance(op, ForwardEnable):
+                elif op_type is ForwardEnable:
                     for node_idx in ckpt_region:
                         for n in node_list[node_idx]:
                             n.meta['activation_checkpoint'].append(ckpt_idx)
@@ -402,7 +421,7 @@ class CheckpointSolverRotor(CheckpointSolverBase):
                     ckpt_idx += 1
                     ckpt_region = []
 
-                elif isinstance(op, ForwardCheck):
+                elif op_type is ForwardCheck:
                     for node_idx in ckpt_region:
                         for n in node_list[node_idx]:
                             n.meta['activation_checkpoint'].append(ckpt_idx)
@@ -410,7 +429,7 @@ class CheckpointSolverRotor(CheckpointSolverBase):
                     ckpt_idx += 1
                     ckpt_region = [op.index]
 
-                elif isinstance(op, Backward):
+                elif op_type is Backward:
                     for node_idx in ckpt_region:
                         for n in node_list[node_idx]:
                             n.meta['activation_checkpoint'].append(ckpt_idx)
@@ -418,18 +437,16 @@ class CheckpointSolverRotor(CheckpointSolverBase):
                     in_recompute = False
 
             else:
-                if not isinstance(op, Backward):
+                if op_type is not Backward:
                     in_recompute = True
                     ckpt_idx = 0
                     ckpt_region = []
-                    if isinstance(op, ForwardCheck):
+                    if op_type is ForwardCheck:
                         ckpt_region.append(op.index)
 
         # postprocess, make sure every activation checkpoint label in the
         # same activation checkpoint region (level = 0) has the same length
-        op_list = []
-        for node in node_list:
-            op_list += node
+        op_list = list(chain_iter(node_list))
         ckpt_regions = _find_nested_ckpt_regions(op_list)
         for (start_idx, end_idx) in ckpt_regions:
             nested_length = max(
@@ -1,6 +1,5 @@
 import operator
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from enum import Enum
 from functools import reduce
 from typing import Dict, List, Union
@@ -91,7 +90,9 @@ class Padder(BmmTransform):
         self.padded_dim_mapping = {}
 
     def apply(self, shape_mapping: Dict[str, List[int]]):
-        mapping_copy = deepcopy(shape_mapping)
+        # the mapping only holds flat lists of dims, so the lists are copied
+        # directly instead of going through deepcopy
+        mapping_copy = {key: list(shape) for key, shape in shape_mapping.items()}
         input_shape = mapping_copy['input']
         other_shape = mapping_copy['other']
 
@@ -50,22 +50,81 @@ class NodeHandler(ABC):
         """
         Compute the resharding costs and save the costs in the ShardingStrategy object.
         """
+        self.update_resharding_cost_batch([strategy])
+        return strategy
+
+    def update_resharding_cost_batch(self, strategies: List[ShardingStrategy]) -> None:
+        """
+        Compute the resharding costs for a batch of strategies in one pass.
+
+        The sharding specs exposed by a predecessor node do not depend on the candidate
+        strategy, so they are resolved once per predecessor and shared by the whole
+        batch; the pairwise costs are memoized across strategies as well.
+        """
         # TODO: test this function when other handlers are ready
-        resharding_costs = {}
         shape_consistency_manager = ShapeConsistencyManager()
 
+        def _compute_resharding_cost(
+                prev_sharding_spec: Union[ShardingSpec,
+                                          List[ShardingSpec]], current_sharding_spec: Union[ShardingSpec,
+                                                                                            List[ShardingSpec]],
+                data: Union[torch.Tensor, List[torch.Tensor], Tuple[torch.Tensor]]) -> TrainCycleItem:
+            """
+            This is a helper function to compute the resharding cost for a specific strategy of a node.
+            """
+            if prev_sharding_spec is None:
+                return TrainCycleItem(fwd=0, bwd=0, total=0)
+            elif isinstance(prev_sharding_spec, ShardingSpec):
+                if isinstance(data, torch.Tensor):
+                    dtype = data.dtype
+                    size_per_elem_bytes = torch.tensor([], dtype=dtype).element_size()
+                    _, _, consistency_cost = shape_consistency_manager.shape_consistency(
+                        prev_sharding_spec, current_sharding_spec)
+
+                    resharding_cost = TrainCycleItem(fwd=consistency_cost["forward"] * size_per_elem_bytes,
+                                                     bwd=consistency_cost["backward"] * size_per_elem_bytes,
+                                                     total=consistency_cost["total"] * size_per_elem_bytes)
+                    return resharding_cost
+                else:
+                    # This raise is used to check if we have missed any type of data.
+                    # It could be merged into Parameter branch, which means we won't handle
+                    # non-tensor arguments.
+                    raise ValueError(f'Unsupported data type {type(data)}')
+            else:
+                assert isinstance(prev_sharding_spec, (tuple, list)), \
+                    f'prev_sharding_spec should be in type of ShardingSpec, List[ShardingSpec], \
+                        or Tuple[ShardingSpec], but got {type(prev_sharding_spec)}'
+
+                fwd_cost = 0
+                bwd_cost = 0
+                total_cost = 0
+                for index, (prev_sharding_spec_item,
+                            current_sharding_spec_item) in enumerate(zip(prev_sharding_spec, current_sharding_spec)):
+                    item_cost = _compute_resharding_cost(prev_sharding_spec_item, current_sharding_spec_item,
+                                                         data[index])
+                    fwd_cost += item_cost.fwd
+                    bwd_cost += item_cost.bwd
+                    total_cost += item_cost.total
+                resharding_cost = TrainCycleItem(fwd=fwd_cost, bwd=bwd_cost, total=total_cost)
+                return resharding_cost
+
+        def _sharding_spec_key(sharding_spec):
+            """
+            Compute a hashable canonical form of a sharding spec, so that equal specs
+            produced by different strategies are only processed once.
+            """
+            if sharding_spec is None:
+                return None
+            if isinstance(sharding_spec, (tuple, list)):
+                return tuple(_sharding_spec_key(spec) for spec in sharding_spec)
+            return tuple(
+                sorted((dim, tuple(shard_list)) for dim, shard_list in sharding_spec.dim_partition_dict.items()))
+
+        for strategy in strategies:
+            strategy.resharding_costs = {}
+
         for node in self.predecessor_node:
             node_name = str(node)
-            # get the current sharding spec generated by this node handler
-
-            # we will not compute the resharding costs for the node not counted in the strategy.
-            # And the node with tuple or list output need to be handled below.
-            node_in_strategy = [op_data.name for op_data in strategy.sharding_specs.keys()]
-            if str(node) not in node_in_strategy:
-                continue
-
-            op_data = strategy.get_op_data_by_name(node_name)
-            current_sharding_spec = strategy.sharding_specs[op_data]
             # get the sharding specs for this node generated
             # in its own node handler
             assert hasattr(node, 'strategies_vector'), \
@@ -74,64 +133,36 @@ class NodeHandler(ABC):
             prev_sharding_specs = [
                 prev_strategy.get_sharding_spec_by_name(node_name) for prev_strategy in prev_strategy_vector
             ]
-
-            # create data structrure to store costs
-            if node not in resharding_costs:
-                resharding_costs[node] = []
-
-            def _compute_resharding_cost(
-                    prev_sharding_spec: Union[ShardingSpec,
-                                              List[ShardingSpec]], current_sharding_spec: Union[ShardingSpec,
-                                                                                                List[ShardingSpec]],
-                    data: Union[torch.Tensor, List[torch.Tensor], Tuple[torch.Tensor]]) -> TrainCycleItem:
-                """
-                This is a helper function to compute the resharding cost for a specific strategy of a node.
-                """
-                if prev_sharding_spec is None:
-                    return TrainCycleItem(fwd=0, bwd=0, total=0)
-                elif isinstance(prev_sharding_spec, ShardingSpec):
-                    if isinstance(data, torch.Tensor):
-                        dtype = data.dtype
-                        size_per_elem_bytes = torch.tensor([], dtype=dtype).element_size()
-                        _, _, consistency_cost = shape_consistency_manager.shape_consistency(
-                            prev_sharding_spec, current_sharding_spec)
-
-                        resharding_cost = TrainCycleItem(fwd=consistency_cost["forward"] * size_per_elem_bytes,
-                                                         bwd=consistency_cost["backward"] * size_per_elem_bytes,
-                                                         total=consistency_cost["total"] * size_per_elem_bytes)
-                        return resharding_cost
-                    else:
-                        # This raise is used to check if we have missed any type of data.
-                        # It could be merged into Parameter branch, which means we won't handle
-                        # non-tensor arguments.
-                        raise ValueError(f'Unsupported data type {type(data)}')
-                else:
-                    assert isinstance(prev_sharding_spec, (tuple, list)), \
-                        f'prev_sharding_spec should be in type of ShardingSpec, List[ShardingSpec], \
-                            or Tuple[ShardingSpec], but got {type(prev_sharding_spec)}'
-
-                    fwd_cost = 0
-                    bwd_cost = 0
-                    total_cost = 0
-                    for index, (prev_sharding_spec_item,
-                                current_sharding_spec_item) in enumerate(zip(prev_sharding_spec,
-                                                                             current_sharding_spec)):
-                        item_cost = _compute_resharding_cost(prev_sharding_spec_item, current_sharding_spec_item,
-                                                             data[index])
-                        fwd_cost += item_cost.fwd
-                        bwd_cost += item_cost.bwd
-                        total_cost += item_cost.total
-                    resharding_cost = TrainCycleItem(fwd=fwd_cost, bwd=bwd_cost, total=total_cost)
-                    return resharding_cost
+            prev_spec_keys = [_sharding_spec_key(spec) for spec in prev_sharding_specs]
 
             # for each sharding spec generated by the predecessor's node handler
             # compute the resharding cost to switch to the sharding spec generated
             # by the current node handler
-            for prev_sharding_spec in prev_sharding_specs:
-                resharding_cost = _compute_resharding_cost(prev_sharding_spec, current_sharding_spec, op_data.data)
-                resharding_costs[node].append(resharding_cost)
-        strategy.resharding_costs = resharding_costs
-        return strategy
+            # many strategies share the same sharding specs, so the computed costs
+            # are memoized on the canonical forms of the spec pair
+            cost_cache = {}
+            for strategy in strategies:
+                # we will not compute the resharding costs for the node not counted in the strategy.
+                # And the node with tuple or list output need to be handled below.
+                node_in_strategy = [op_data.name for op_data in strategy.sharding_specs.keys()]
+                if node_name not in node_in_strategy:
+                    continue
+
+                op_data = strategy.get_op_data_by_name(node_name)
+                current_sharding_spec = strategy.sharding_specs[op_data]
+                current_spec_key = _sharding_spec_key(current_sharding_spec)
+
+                resharding_cost_list = []
+                for prev_sharding_spec, prev_spec_key in zip(prev_sharding_specs, prev_spec_keys):
+                    cache_key = (prev_spec_key, current_spec_key)
+                    if cache_key in cost_cache:
+                        resharding_cost = cost_cache[cache_key]
+                    else:
+                        resharding_cost = _compute_resharding_cost(prev_sharding_spec, current_sharding_spec,
+                                                                   op_data.data)
+                        cost_cache[cache_key] = resharding_cost
+                    resharding_cost_list.append(resharding_cost)
+                strategy.resharding_costs[node] = resharding_cost_list
 
     def get_target_function(self) -> callable:
         """
@@ -174,8 +205,7 @@ class NodeHandler(ABC):
             # compute the resharding costs based on the previous node
             # strategies if specified
             if compute_resharding_cost:
-                updated_strategies = map(self.update_resharding_cost, post_processed_strategies)
-                post_processed_strategies = list(updated_strategies)
+                self.update_resharding_cost_batch(post_processed_strategies)
 
             self.strategies_vector.extend(post_processed_strategies)
 
@@ -206,8 +236,14 @@ class NodeHandler(ABC):
                 if shard_level != 1 or using_last_axis == False:
                     remove_strategy_list.append(strategy)
 
-        for strategy in remove_strategy_list:
-            self.strategies_vector.remove(strategy)
+        # list.remove would compare the dataclasses field by field and rescan the
+        # vector per removal, so the kept strategies are filtered out by identity
+        # in a single pass instead
+        if remove_strategy_list:
+            remove_ids = {id(strategy) for strategy in remove_strategy_list}
+            self.strategies_vector[:] = [
+                strategy for strategy in self.strategies_vector if id(strategy) not in remove_ids
+            ]
 
         return self.strategies_vector
 
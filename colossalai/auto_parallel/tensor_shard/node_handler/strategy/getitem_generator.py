@@ -1,12 +1,11 @@
-import copy
 from typing import List
 
 from colossalai.auto_parallel.tensor_shard.sharding_strategy import (
     CommType,
-    MemoryCost,
     ShardingStrategy,
     TrainCycleItem,
 )
+from colossalai.auto_parallel.tensor_shard.utils import shallow_copy_dim_partition_dict
 from colossalai.logging import get_dist_logger
 from colossalai.tensor.shape_consistency import CollectiveCommPattern
 from colossalai.tensor.sharding_spec import ShardingSpecException
@@ -34,35 +33,6 @@ class GetItemStrategyGenerator(FollowingStrategyGenerator):
         compute_cost = TrainCycleItem(fwd=10, bwd=10, total=20)
         strategy.compute_cost = compute_cost
 
-    def update_memory_cost(self, strategy: ShardingStrategy):
-        '''
-        Compute the memory cost per device with this specific strategy.
-        '''
-        forward_size_mapping = {
-            'input': self._compute_size_in_bytes(strategy, "input"),
-            'output': self._compute_size_in_bytes(strategy, "output")
-        }
-
-        backward_size_mapping = copy.deepcopy(forward_size_mapping)
-        backward_size_mapping.pop("output")
-        # compute fwd cost incurred
-        # fwd_cost = input + output
-        fwd_activation_cost = sum([v for k, v in forward_size_mapping.items() if not self.is_param(k)])
-        fwd_parameter_cost = sum([v for k, v in forward_size_mapping.items() if self.is_param(k)])
-        fwd_mem_cost = MemoryCost(activation=fwd_activation_cost, parameter=fwd_parameter_cost)
-
-        # compute bwd cost incurred
-        # bwd_cost = input_grad
-        bwd_activation_cost = sum([v for k, v in backward_size_mapping.items() if not self.is_param(k)])
-        bwd_parameter_cost = sum([v for k, v in backward_size_mapping.items() if self.is_param(k)])
-        bwd_mem_cost = MemoryCost(activation=bwd_activation_cost, parameter=bwd_parameter_cost)
-
-        # compute total cost
-        total_mem_cost = MemoryCost(activation=fwd_activation_cost + bwd_activation_cost,
-                                    parameter=fwd_parameter_cost + bwd_parameter_cost)
-        memory_cost = TrainCycleItem(fwd=fwd_mem_cost, bwd=bwd_mem_cost, total=total_mem_cost)
-        strategy.memory_cost = memory_cost
-
 
 class TensorStrategyGenerator(GetItemStrategyGenerator):
     '''
@@ -71,46 +41,62 @@ class TensorStrategyGenerator(GetItemStrategyGenerator):
 
     def collate_strategies(self) -> List[ShardingStrategy]:
         strategy_list = []
+        logger = get_dist_logger()
         getitem_index = self.op_data['index'].data
+
+        # the index pattern only depends on the node, so resolve it once before
+        # iterating over the predecessor strategies.
+        int_index = False
+        shift_length = 0
+        if isinstance(getitem_index, int):
+            int_index = True
+            getitem_dims = [
+                0,
+            ]
+            shift_length = 1
+        elif isinstance(getitem_index, slice):
+            getitem_dims = [
+                0,
+            ]
+        else:
+            getitem_dims = [i for i in range(len(getitem_index))]
+            if isinstance(getitem_index[0], int):
+                int_index = True
+                shift_length = len(getitem_index)
+
+        # many predecessor strategies expose the same output sharding spec, so the
+        # input/output dim partition transforms are memoized on a canonical form of
+        # the input dict and copied on reuse
+        transform_cache = {}
         for index, strategy in enumerate(self.predecessor_node.strategies_vector):
             try:
-                logger = get_dist_logger()
                 dim_partition_dict_mapping = {}
                 communication_action_mapping = {}
-                dim_partition_dict_for_input = copy.deepcopy(
-                    strategy.output_sharding_specs[self.op_data["input"]].dim_partition_dict)
-
-                int_index = False
-                if isinstance(getitem_index, int):
-                    int_index = True
-                    getitem_dims = [
-                        0,
-                    ]
-                    shift_length = 1
-                elif isinstance(getitem_index, slice):
-                    getitem_dims = [
-                        0,
-                    ]
+                input_dim_partition_dict = strategy.output_sharding_specs[self.op_data["input"]].dim_partition_dict
+                cache_key = tuple(
+                    sorted((dim, tuple(shard_list)) for dim, shard_list in input_dim_partition_dict.items()))
+                cached_transform = transform_cache.get(cache_key)
+                if cached_transform is not None:
+                    dim_partition_dict_for_input = shallow_copy_dim_partition_dict(cached_transform[0])
+                    dim_partition_dict_for_output = shallow_copy_dim_partition_dict(cached_transform[1])
                 else:
-                    getitem_dims = [i for i in range(len(getitem_index))]
-                    if isinstance(getitem_index[0], int):
-                        int_index = True
-                        shift_length = len(getitem_index)
-
-                gather_dims = []
-                for dim in getitem_dims:
-                    if dim in dim_partition_dict_for_input:
-                        gather_dims.append(dim)
-
-                for dim in gather_dims:
-                    dim_partition_dict_for_input.pop(dim)
-                dim_partition_dict_for_output = copy.deepcopy(dim_partition_dict_for_input)
-
-                if int_index:
-                    shift_dim_partition_dict_for_output = {}
-                    for dim, mesh_dim_list in dim_partition_dict_for_output.items():
-                        shift_dim_partition_dict_for_output[dim - shift_length] = mesh_dim_list
-                    dim_partition_dict_for_output = shift_dim_partition_dict_for_output
+                    dim_partition_dict_for_input = shallow_copy_dim_partition_dict(input_dim_partition_dict)
+
+                    gather_dims = []
+                    for dim in getitem_dims:
+                        if dim in dim_partition_dict_for_input:
+                            gather_dims.append(dim)
+
+                    for dim in gather_dims:
+                        dim_partition_dict_for_input.pop(dim)
+                    dim_partition_dict_for_output = shallow_copy_dim_partition_dict(dim_partition_dict_for_input)
+
+                    if int_index:
+                        shift_dim_partition_dict_for_output = {}
+                        for dim, mesh_dim_list in dim_partition_dict_for_output.items():
+                            shift_dim_partition_dict_for_output[dim - shift_length] = mesh_dim_list
+                        dim_partition_dict_for_output = shift_dim_partition_dict_for_output
+                    transform_cache[cache_key] = (dim_partition_dict_for_input, dim_partition_dict_for_output)
 
                 dim_partition_dict_mapping = {
                     "input": dim_partition_dict_for_input,
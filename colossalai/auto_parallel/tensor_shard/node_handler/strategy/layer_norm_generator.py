@@ -1,4 +1,3 @@
-import copy
 import operator
 from functools import reduce
 from typing import List
@@ -75,7 +74,8 @@ class LayerNormGenerator(StrategyGenerator):
             bias_size = self._compute_size_in_bytes(strategy, "bias")
             forward_size_mapping['bias'] = bias_size
 
-        backward_size_mapping = copy.deepcopy(forward_size_mapping)
+        # the size mapping is a flat dict of numbers, a shallow copy is enough
+        backward_size_mapping = dict(forward_size_mapping)
         backward_size_mapping.pop("output")
         # compute fwd cost incurred
         # fwd_cost = input + other + bias + output
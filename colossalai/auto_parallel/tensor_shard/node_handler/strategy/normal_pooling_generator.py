@@ -1,4 +1,3 @@
-import copy
 import operator
 from functools import reduce
 from typing import List
@@ -65,7 +64,8 @@ class NormalPoolStrategyGenerator(StrategyGenerator):
             'output': self._compute_size_in_bytes(strategy, "output")
         }
 
-        backward_size_mapping = copy.deepcopy(forward_size_mapping)
+        # the size mapping is a flat dict of numbers, a shallow copy is enough
+        backward_size_mapping = dict(forward_size_mapping)
         backward_size_mapping.pop("output")
         # compute fwd cost incurred
         # fwd_cost = input + output
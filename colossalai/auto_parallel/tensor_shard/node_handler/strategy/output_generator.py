@@ -49,16 +49,18 @@ class OutputGenerator(OutputStrategyGenerator):
         """
         Generate replica strategy for output node.
         """
-        dim_partition_dict_mapping = {}
-        dim_partition_dict_for_output = []
-        for index, _ in enumerate(self.predecessor_nodes):
-            mapping_name = f"input_{index}"
-            if isinstance(self.op_data[mapping_name].data, (tuple, list)):
-                dim_partition_dict_for_input = [{} for _ in range(len(self.op_data[mapping_name].data))]
-            else:
-                dim_partition_dict_for_input = {}
-            dim_partition_dict_mapping[mapping_name] = dim_partition_dict_for_input
-            dim_partition_dict_for_output.append(dim_partition_dict_for_input)
+        def _replicated_dim_partition_dict(data):
+            if isinstance(data, (tuple, list)):
+                return [{} for _ in range(len(data))]
+            return {}
+
+        # every input is replicated, so the mapping is built in a single comprehension
+        # instead of re-binding temporaries per input
+        dim_partition_dict_mapping = {
+            f"input_{index}": _replicated_dim_partition_dict(self.op_data[f"input_{index}"].data)
+            for index in range(len(self.predecessor_nodes))
+        }
+        dim_partition_dict_for_output = list(dim_partition_dict_mapping.values())
 
         if len(dim_partition_dict_for_output) == 1:
             dim_partition_dict_for_output = dim_partition_dict_for_output[0]
@@ -96,9 +98,8 @@ class OutputGenerator(OutputStrategyGenerator):
                     0: mesh_list
                 },
             }
-        for index, _ in enumerate(self.predecessor_nodes):
-            mapping_name = f"input_{index}"
-            dim_partition_dict_mapping[mapping_name] = {0: mesh_list}
+        for index in range(len(self.predecessor_nodes)):
+            dim_partition_dict_mapping[f"input_{index}"] = {0: mesh_list}
 
         communication_action_mapping = {}
         sharding_spec_mapping = self.to_sharding_spec_mapping(dim_partition_dict_mapping)
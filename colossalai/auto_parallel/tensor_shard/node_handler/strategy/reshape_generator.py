@@ -1,11 +1,9 @@
-import copy
 from typing import List
 
 from colossalai.auto_parallel.tensor_shard.node_handler.strategy.strategy_generator import FollowingStrategyGenerator
 from colossalai.auto_parallel.tensor_shard.sharding_strategy import (
     CommAction,
     CommType,
-    MemoryCost,
     ShardingStrategy,
     TrainCycleItem,
 )
@@ -13,6 +11,7 @@ from colossalai.auto_parallel.tensor_shard.utils import (
     check_keep_sharding_status,
     detect_reshape_mapping,
     infer_output_dim_partition_dict,
+    shallow_copy_dim_partition_dict,
 )
 from colossalai.tensor.shape_consistency import CollectiveCommPattern
 from colossalai.tensor.sharding_spec import ShardingSpec
@@ -32,35 +31,6 @@ class ReshapeGenerator(FollowingStrategyGenerator):
         compute_cost = TrainCycleItem(fwd=10, bwd=10, total=20)
         strategy.compute_cost = compute_cost
 
-    def update_memory_cost(self, strategy: ShardingStrategy):
-        '''
-        Compute the memory cost per device with this specific strategy.
-        '''
-        forward_size_mapping = {
-            'input': self._compute_size_in_bytes(strategy, "input"),
-            'output': self._compute_size_in_bytes(strategy, "output")
-        }
-
-        backward_size_mapping = copy.deepcopy(forward_size_mapping)
-        backward_size_mapping.pop("output")
-        # compute fwd cost incurred
-        # fwd_cost = input + output
-        fwd_activation_cost = sum([v for k, v in forward_size_mapping.items() if not self.is_param(k)])
-        fwd_parameter_cost = sum([v for k, v in forward_size_mapping.items() if self.is_param(k)])
-        fwd_mem_cost = MemoryCost(activation=fwd_activation_cost, parameter=fwd_parameter_cost)
-
-        # compute bwd cost incurred
-        # bwd_cost = input_grad
-        bwd_activation_cost = sum([v for k, v in backward_size_mapping.items() if not self.is_param(k)])
-        bwd_parameter_cost = sum([v for k, v in backward_size_mapping.items() if self.is_param(k)])
-        bwd_mem_cost = MemoryCost(activation=bwd_activation_cost, parameter=bwd_parameter_cost)
-
-        # compute total cost
-        total_mem_cost = MemoryCost(activation=fwd_activation_cost + bwd_activation_cost,
-                                    parameter=fwd_parameter_cost + bwd_parameter_cost)
-        memory_cost = TrainCycleItem(fwd=fwd_mem_cost, bwd=bwd_mem_cost, total=total_mem_cost)
-        strategy.memory_cost = memory_cost
-
     def collate_strategies(self) -> List[ShardingStrategy]:
         return super().collate_strategies()
 
@@ -72,16 +42,17 @@ class ViewGenerator(ReshapeGenerator):
 
     def collate_strategies(self) -> List[ShardingStrategy]:
         strategy_list = []
+        # the reshape mapping only depends on the node, so compute it once before
+        # iterating over the predecessor strategies.
+        origin_shape = self.op_data['input'].data.shape
+        tgt_shape = self.op_data['tgt_shape'].data
+        reshape_mapping_dict = detect_reshape_mapping(origin_shape, tgt_shape)
+
         for index, strategy in enumerate(self.predecessor_node.strategies_vector):
             dim_partition_dict_mapping = {}
             communication_action_mapping = {}
             input_sharding_spec = strategy.output_sharding_specs[self.op_data["input"]]
 
-            origin_shape = self.op_data['input'].data.shape
-            tgt_shape = self.op_data['tgt_shape'].data
-
-            reshape_mapping_dict = detect_reshape_mapping(origin_shape, tgt_shape)
-
             dim_partition_dict_for_input = input_sharding_spec.dim_partition_dict
             keep_sharding_status = check_keep_sharding_status(dim_partition_dict_for_input, reshape_mapping_dict)
 
@@ -154,12 +125,12 @@ class PermuteGenerator(ReshapeGenerator):
 
     def collate_strategies(self) -> List[ShardingStrategy]:
         strategy_list = []
+        permute_dims = self.op_data['permute_dims'].data
         for index, strategy in enumerate(self.predecessor_node.strategies_vector):
             dim_partition_dict_mapping = {}
             communication_action_mapping = {}
             input_sharding_spec = strategy.output_sharding_specs[self.op_data["input"]]
 
-            permute_dims = self.op_data['permute_dims'].data
             dim_partition_dict_for_input = input_sharding_spec.dim_partition_dict
             dim_partition_dict_for_output = {}
             for dim_index, permute_dim in enumerate(permute_dims):
@@ -192,6 +163,9 @@ class TransposeGenerator(ReshapeGenerator):
 
     def collate_strategies(self) -> List[ShardingStrategy]:
         strategy_list = []
+        transpose_dims = self.op_data['transpose_dims'].data
+        dim_0 = transpose_dims[0]
+        dim_1 = transpose_dims[1]
         for index, strategy in enumerate(self.predecessor_node.strategies_vector):
             dim_partition_dict_mapping = {}
             communication_action_mapping = {}
@@ -199,9 +173,6 @@ class TransposeGenerator(ReshapeGenerator):
             dim_partition_dict_for_input = input_sharding_spec.dim_partition_dict
             dim_partition_dict_for_output = {}
 
-            transpose_dims = self.op_data['transpose_dims'].data
-            dim_0 = transpose_dims[0]
-            dim_1 = transpose_dims[1]
             for dim, sharded_dims in dim_partition_dict_for_input.items():
                 if dim == dim_0:
                     dim_partition_dict_for_output[dim_1] = dim_partition_dict_for_input[dim_0]
@@ -236,19 +207,20 @@ class SplitGenerator(ReshapeGenerator):
 
     def collate_strategies(self) -> List[ShardingStrategy]:
         strategy_list = []
+        split_size, split_dim = self.op_data['split_info'].data
+        num_outputs = len(self.op_data["output"].data)
         for index, strategy in enumerate(self.predecessor_node.strategies_vector):
             recover_dims = None
             dim_partition_dict_mapping = {}
             communication_action_mapping = {}
             input_sharding_spec = strategy.output_sharding_specs[self.op_data["input"]]
-            dim_partition_dict_for_input = copy.deepcopy(input_sharding_spec.dim_partition_dict)
-            split_size, split_dim = self.op_data['split_info'].data
+            dim_partition_dict_for_input = shallow_copy_dim_partition_dict(input_sharding_spec.dim_partition_dict)
 
             if split_dim in dim_partition_dict_for_input:
                 recover_dims = dim_partition_dict_for_input.pop(split_dim)
 
             dim_partition_dict_for_output = [
-                copy.deepcopy(dim_partition_dict_for_input) for _ in range(len(self.op_data["output"].data))
+                shallow_copy_dim_partition_dict(dim_partition_dict_for_input) for _ in range(num_outputs)
             ]
             assert len(dim_partition_dict_for_output) >= 2
             dim_partition_dict_mapping = {
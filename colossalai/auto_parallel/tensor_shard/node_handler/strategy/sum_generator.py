@@ -1,4 +1,3 @@
-import copy
 import operator
 from functools import reduce
 from typing import List
@@ -7,7 +6,6 @@ from colossalai.auto_parallel.tensor_shard.node_handler.strategy.strategy_genera
 from colossalai.auto_parallel.tensor_shard.sharding_strategy import (
     CommAction,
     CommType,
-    MemoryCost,
     ShardingStrategy,
     TrainCycleItem,
 )
@@ -15,6 +13,7 @@ from colossalai.auto_parallel.tensor_shard.utils import (
     check_keep_sharding_status,
     detect_reshape_mapping,
     infer_output_dim_partition_dict,
+    shallow_copy_dim_partition_dict,
 )
 from colossalai.tensor.shape_consistency import CollectiveCommPattern
 from colossalai.tensor.sharding_spec import ShardingSpec
@@ -42,43 +41,14 @@ class SumGenerator(FollowingStrategyGenerator):
 
         strategy.compute_cost = compute_cost
 
-    def update_memory_cost(self, strategy: ShardingStrategy):
-        '''
-        Compute the memory cost per device with this specific strategy.
-        '''
-        forward_size_mapping = {
-            'input': self._compute_size_in_bytes(strategy, "input"),
-            'output': self._compute_size_in_bytes(strategy, "output")
-        }
-
-        backward_size_mapping = copy.deepcopy(forward_size_mapping)
-        backward_size_mapping.pop("output")
-        # compute fwd cost incurred
-        # fwd_cost = input + output
-        fwd_activation_cost = sum([v for k, v in forward_size_mapping.items() if not self.is_param(k)])
-        fwd_parameter_cost = sum([v for k, v in forward_size_mapping.items() if self.is_param(k)])
-        fwd_mem_cost = MemoryCost(activation=fwd_activation_cost, parameter=fwd_parameter_cost)
-
-        # compute bwd cost incurred
-        # bwd_cost = input_grad
-        bwd_activation_cost = sum([v for k, v in backward_size_mapping.items() if not self.is_param(k)])
-        bwd_parameter_cost = sum([v for k, v in backward_size_mapping.items() if self.is_param(k)])
-        bwd_mem_cost = MemoryCost(activation=bwd_activation_cost, parameter=bwd_parameter_cost)
-
-        # compute total cost
-        total_mem_cost = MemoryCost(activation=fwd_activation_cost + bwd_activation_cost,
-                                    parameter=fwd_parameter_cost + bwd_parameter_cost)
-        memory_cost = TrainCycleItem(fwd=fwd_mem_cost, bwd=bwd_mem_cost, total=total_mem_cost)
-        strategy.memory_cost = memory_cost
-
     def collate_strategies(self) -> List[ShardingStrategy]:
         strategy_list = []
+        sum_dims, sum_mapping_dict = self.op_data['sum_info'].data
         for index, strategy in enumerate(self.predecessor_node.strategies_vector):
             dim_partition_dict_mapping = {}
             communication_action_mapping = {}
             input_sharding_spec = strategy.output_sharding_specs[self.op_data["input"]]
-            dim_partition_dict_for_input = copy.deepcopy(input_sharding_spec.dim_partition_dict)
-            sum_dims, sum_mapping_dict = self.op_data['sum_info'].data
+            dim_partition_dict_for_input = shallow_copy_dim_partition_dict(input_sharding_spec.dim_partition_dict)
 
             # TODO: a better way to handle the distributed sum is sum all the data on chip and then do all reduce
             # among all the shard groups
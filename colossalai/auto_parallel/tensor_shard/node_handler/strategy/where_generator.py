@@ -1,4 +1,3 @@
-import copy
 from typing import List
 
 from colossalai.auto_parallel.tensor_shard.sharding_strategy import MemoryCost, ShardingStrategy, TrainCycleItem
@@ -36,7 +35,8 @@ class WhereGenerator(StrategyGenerator):
             'output': self._compute_size_in_bytes(strategy, "output")
         }
 
-        backward_size_mapping = copy.deepcopy(forward_size_mapping)
+        # the size mapping is a flat dict of numbers, a shallow copy is enough
+        backward_size_mapping = dict(forward_size_mapping)
         backward_size_mapping.pop("output")
         # compute fwd cost incurred
         # fwd_cost = condition + x + y + output
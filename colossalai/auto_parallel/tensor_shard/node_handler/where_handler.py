@@ -1,4 +1,3 @@
-import copy
 import operator
 from typing import Dict, List
 
@@ -53,9 +52,12 @@ class WhereHandler(NodeHandler):
         return logical_mapping, physical_mapping
 
     def convert_physical_operand_to_logical_operand(self, physical_operand, target_shape):
-        logical_operand = copy.deepcopy(physical_operand)
-        logical_operand.logical_shape = target_shape
-        return logical_operand
+        # the logical operand only differs in its logical shape, so a new
+        # OperationData sharing the same data replaces the deepcopy of the meta tensor
+        return OperationData(name=physical_operand.name,
+                             type=physical_operand.type,
+                             data=physical_operand.data,
+                             logical_shape=target_shape)
 
     def post_process(self, strategy: ShardingStrategy):
         logical_op_data_mapping, physical_op_data_mapping = self.get_operation_data_mapping()
@@ -49,6 +49,9 @@ class OperationData:
     logical_shape: Tuple[int] = None
 
     def __post_init__(self):
+        # the identity of an OperationData is its name and instances are used as dict
+        # keys all over strategy generation, so the hash is computed once up front
+        self._hash = hash(self.name)
         # if no logical shape is specified, use the data shape as the logical shape
         if self.logical_shape is None:
 
@@ -75,7 +78,7 @@ class OperationData:
         return other.name == self.name
 
     def __hash__(self) -> int:
-        return hash(f'{self.name}')
+        return self._hash
 
 
 @dataclass
@@ -238,10 +241,25 @@ class StrategiesVector(list):
     def __init__(self, node: Node):
         super().__init__()
         self.node = node
-        # fetch its input and output nodes
+        # the input and output nodes are resolved lazily, as many call sites never
+        # touch them
+        self._predecessor_nodes = None
+        self._successor_nodes = None
+
+    @property
+    def predecessor_nodes(self):
+        # fetch its input nodes
         # TODO: placeholder input nodes
-        self.predecessor_nodes = list(node._input_nodes.keys())
-        self.successor_nodes = list(node.users.keys())
+        if self._predecessor_nodes is None:
+            self._predecessor_nodes = list(self.node._input_nodes.keys())
+        return self._predecessor_nodes
+
+    @property
+    def successor_nodes(self):
+        # fetch its output nodes
+        if self._successor_nodes is None:
+            self._successor_nodes = list(self.node.users.keys())
+        return self._successor_nodes
 
     def check_merge(self):
         merge_label = False
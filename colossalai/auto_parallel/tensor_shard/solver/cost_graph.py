@@ -1,3 +1,4 @@
+import numpy as np
 import torch
 
 from colossalai.auto_parallel.tensor_shard.constants import INFINITY_COST
@@ -121,32 +122,34 @@ class CostGraph:
             dst_node(Node): The node to integrate src_node.
         '''
         # build merge_map
+        # collect the resharding costs into a (src_strategy, dst_strategy) matrix
+        # so that the minimum search runs in numpy instead of a quadratic python loop.
+        src_len = self.node_lens[src_node]
+        dst_len = len(dst_node.strategies_vector)
+        cost_matrix = np.empty((src_len, dst_len), dtype=np.float64)
+        for dst_index, dst_strategy in enumerate(dst_node.strategies_vector):
+            resharding_cost_list = dst_strategy.resharding_costs[src_node]
+            if self.forward_only:
+                cost_matrix[:, dst_index] = [item.fwd for item in resharding_cost_list]
+            else:
+                cost_matrix[:, dst_index] = [item.total for item in resharding_cost_list]
+
+        # the original scan used `<=`, so ties are resolved to the largest dst index.
+        lowest_cost_indices = dst_len - 1 - np.argmin(cost_matrix[:, ::-1], axis=1)
+        min_costs = cost_matrix[np.arange(src_len), lowest_cost_indices]
         merge_map = {}
-        for src_index, _ in enumerate(src_node.strategies_vector):
-            min_cost = INFINITY_COST
-            lowest_cost_index = -1
-            for dst_index, dst_strategy in enumerate(dst_node.strategies_vector):
-                resharding_cost_item = dst_strategy.resharding_costs[src_node][src_index]
-                if self.forward_only:
-                    resharding_cost = resharding_cost_item.fwd
-                else:
-                    resharding_cost = resharding_cost_item.total
-                if resharding_cost <= min_cost:
-                    min_cost = resharding_cost
-                    lowest_cost_index = dst_index
-            merge_map[src_index] = lowest_cost_index
+        for src_index in range(src_len):
+            if min_costs[src_index] > INFINITY_COST:
+                # keep the sentinel of the original scan when no candidate is affordable
+                merge_map[src_index] = -1
+            else:
+                merge_map[src_index] = int(lowest_cost_indices[src_index])
 
         # extra_node_cost for src node
         self.extra_node_costs[src_node] = [0.0] * self.node_lens[src_node]
         for src_index, strategy in enumerate(src_node.strategies_vector):
             target_strate_index = merge_map[src_index]
-            target_strategy = dst_node.strategies_vector[target_strate_index]
-            resharding_cost_item = target_strategy.resharding_costs[src_node][src_index]
-            if self.forward_only:
-                resharding_cost_to_add = resharding_cost_item.fwd
-            else:
-                resharding_cost_to_add = resharding_cost_item.total
-            self.extra_node_costs[src_node][src_index] += resharding_cost_to_add
+            self.extra_node_costs[src_node][src_index] += float(cost_matrix[src_index, target_strate_index])
             if dst_node in self.extra_node_costs:
                 self.extra_node_costs[src_node][src_index] += self.extra_node_costs[dst_node][target_strate_index]
 
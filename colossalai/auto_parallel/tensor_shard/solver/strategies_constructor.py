@@ -1,8 +1,10 @@
 import builtins
 import math
 import operator
+import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from typing import Dict, List
+from typing import Any, Dict, List
 
 import torch
 from torch.fx import Graph, Node
@@ -13,7 +15,7 @@ from colossalai.auto_parallel.tensor_shard.node_handler import (
     PlaceholderHandler,
     operator_registry,
 )
-from colossalai.auto_parallel.tensor_shard.sharding_strategy import StrategiesVector
+from colossalai.auto_parallel.tensor_shard.sharding_strategy import OperationData, ShardingStrategy, StrategiesVector
 from colossalai.auto_parallel.tensor_shard.utils import generate_resharding_costs, generate_sharding_spec
 from colossalai.device.device_mesh import DeviceMesh
 
@@ -22,6 +24,14 @@ from ..options import DataloaderOption, SolverOptions
 __all__ = ['StrategiesConstructor']
 
 
+class _UncacheableNodeError(Exception):
+    """
+    Raised internally when a node contains arguments which cannot be fingerprinted, so its
+    strategies cannot be shared across structurally identical nodes.
+    """
+    pass
+
+
 class StrategiesConstructor:
     """
     StrategiesConstructor is used to construct the parallelization plan for the model execution.
@@ -37,11 +47,240 @@ class StrategiesConstructor:
         assert graph.owning_module is not None, 'The given graph is not associated with a owning_module'
         self.root_module = self.graph.owning_module
         self.nodes = list(graph.nodes)
+        # flatten the frequently touched node attributes into parallel lists, so the
+        # build loop reads tight arrays instead of chasing attributes on the fx nodes
+        self._node_ops = [node.op for node in self.nodes]
+        self._node_meta = [getattr(node, '_meta_data', None) for node in self.nodes]
         self.device_mesh = device_mesh
         self.leaf_strategies = []
         self.strategy_map = {}
         self.solver_options = solver_options
         self.no_strategy_nodes = []
+        # transformer-style models contain many nodes which are structurally identical, e.g. the
+        # nodes of different layers with the same operation and input shapes. The strategies generated
+        # by the handlers for those nodes are the same except for the node binding, so we cache the
+        # generated strategies keyed by a structural fingerprint and clone them on cache hits to avoid
+        # invoking the handler and recomputing the resharding costs over and over again.
+        self._strategy_cache: Dict[tuple, tuple] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # accumulated strategy build time per op kind, used to surface which
+        # handlers dominate the build
+        self._op_build_time: Dict[str, float] = {}
+        # get_submodule walks the module tree on every call, so the resolved
+        # submodules are cached per target string
+        self._submodule_cache: Dict[str, torch.nn.Module] = {}
+        # the registry lookup resolves the same handler class for every node with
+        # the same target, so the resolution is flattened into a per-target dict
+        self._handler_cls_cache: Dict[object, type] = {}
+        # the solver options and the op dispatch are resolved once here instead of
+        # being re-tested for every node in build_strategies_and_cost
+        if solver_options.dataloader_option == DataloaderOption.DISTRIBUTED:
+            self._dataloader_option_name = 'distributed'
+        else:
+            assert solver_options.dataloader_option == DataloaderOption.REPLICATED, f'dataloader_option {solver_options.dataloader_option} is not supported'
+            self._dataloader_option_name = 'replicated'
+        self._shard_option = solver_options.shard_option
+        self._solver_perference = solver_options.solver_perference
+        self._op_dispatch = {
+            'placeholder': self._build_placeholder_strategies,
+            'get_attr': self._build_getattr_strategies,
+            'call_module': self._build_call_strategies,
+            'call_function': self._build_call_strategies,
+            'call_method': self._build_call_strategies,
+            'output': self._build_output_strategies,
+        }
+
+    def _get_submodule(self, target: str) -> torch.nn.Module:
+        '''
+        Fetch a submodule of the root module with a cache on the target string, as repeated
+        submodules (e.g. transformer blocks) make get_submodule re-walk the module tree.
+        '''
+        submodule = self._submodule_cache.get(target)
+        if submodule is None:
+            submodule = self.root_module.get_submodule(target)
+            self._submodule_cache[target] = submodule
+        return submodule
+
+    def _strategy_cache_key(self, node):
+        '''
+        Compute a structural fingerprint for the given node, or None if the node cannot be safely cached.
+
+        Two nodes share the same fingerprint only if they execute the same operation on inputs with the
+        same meta data and their predecessors expose the same sharding strategies, so the strategies
+        generated for one of them can be rebound to the other.
+        '''
+
+        def _data_fingerprint(data):
+            if isinstance(data, torch.Tensor):
+                return (tuple(data.shape), data.dtype)
+            if isinstance(data, torch.Size):
+                return tuple(data)
+            if isinstance(data, slice):
+                return ('slice', data.start, data.stop, data.step)
+            if isinstance(data, (tuple, list)):
+                return tuple(_data_fingerprint(d) for d in data)
+            if isinstance(data, (int, float, bool, str, type(None), torch.dtype)):
+                return data
+            # unhashable or unknown argument type, give up caching for this node
+            raise _UncacheableNodeError
+
+        def _sharding_spec_fingerprint(sharding_spec):
+            if sharding_spec is None:
+                return None
+            if isinstance(sharding_spec, (tuple, list)):
+                return tuple(_sharding_spec_fingerprint(spec) for spec in sharding_spec)
+            return tuple(sorted((dim, tuple(shard_list)) for dim, shard_list in sharding_spec.dim_partition_dict.items()))
+
+        try:
+            if node.op == 'call_module':
+                submod = self._get_submodule(node.target)
+                target_key = (type(submod),
+                              tuple((name, tuple(param.shape), param.dtype)
+                                    for name, param in submod.named_parameters(recurse=False)),
+                              tuple((name, tuple(buffer.shape), buffer.dtype)
+                                    for name, buffer in submod.named_buffers(recurse=False)))
+            elif node.op == 'call_function':
+                target_key = node.target
+            elif node.op == 'call_method':
+                target_key = (node.target, type(node.args[0]._meta_data))
+            else:
+                return None
+
+            predecessor_nodes = list(node._input_nodes.keys())
+            node_to_index = {pred: index for index, pred in enumerate(predecessor_nodes)}
+
+            def _arg_fingerprint(arg):
+                if isinstance(arg, Node):
+                    return ('node', node_to_index[arg])
+                if isinstance(arg, (tuple, list)):
+                    return tuple(_arg_fingerprint(a) for a in arg)
+                return _data_fingerprint(arg)
+
+            args_key = tuple(_arg_fingerprint(arg) for arg in node.args)
+            kwargs_key = tuple((k, _arg_fingerprint(v)) for k, v in sorted(node.kwargs.items()))
+
+            predecessor_keys = []
+            for pred in predecessor_nodes:
+                pred_strategy_key = tuple(
+                    _sharding_spec_fingerprint(strategy.get_sharding_spec_by_name(str(pred)))
+                    for strategy in pred.strategies_vector)
+                predecessor_keys.append((_data_fingerprint(pred._meta_data), pred_strategy_key))
+
+            return (node.op, target_key, _data_fingerprint(node._meta_data), args_key, kwargs_key,
+                    tuple(predecessor_keys))
+        except (_UncacheableNodeError, KeyError, AttributeError, TypeError):
+            return None
+
+    def _rebind_cached_strategies(self, cache_entry, node, strategies_vector):
+        '''
+        Clone the cached strategies and rebind them to the given node. The operation data names and the
+        resharding cost keys refer to the node for which the strategies were generated, so they are
+        remapped to the current node and its predecessors by position.
+        '''
+        cached_strategies, cached_node_name, cached_predecessor_names = cache_entry
+        predecessor_nodes = list(node._input_nodes.keys())
+        name_mapping = {cached_node_name: str(node)}
+        node_mapping = {}
+        for cached_name, pred in zip(cached_predecessor_names, predecessor_nodes):
+            name_mapping[cached_name] = str(pred)
+            node_mapping[cached_name] = pred
+
+        def _rebind_op_data(op_data: OperationData) -> OperationData:
+            if op_data.name in name_mapping:
+                return OperationData(name=name_mapping[op_data.name],
+                                     type=op_data.type,
+                                     data=op_data.data,
+                                     logical_shape=op_data.logical_shape)
+            return op_data
+
+        for cached_strategy in cached_strategies:
+            strategy = cached_strategy.clone()
+            strategy.sharding_specs = {
+                _rebind_op_data(op_data): sharding_spec for op_data, sharding_spec in strategy.sharding_specs.items()
+            }
+            if strategy.communication_actions is not None:
+                strategy.communication_actions = {
+                    _rebind_op_data(op_data): comm_action
+                    for op_data, comm_action in strategy.communication_actions.items()
+                }
+            if strategy.resharding_costs is not None:
+                strategy.resharding_costs = {
+                    node_mapping[str(pred)]: costs for pred, costs in strategy.resharding_costs.items()
+                }
+            strategies_vector.append(strategy)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        '''
+        Return the hit/miss statistics of the strategy cache together with the
+        accumulated strategy build time per op kind. This is useful to verify that
+        the structural fingerprints actually match across repeated layers and to
+        surface which handlers dominate the build.
+        '''
+        total_queries = self._cache_hits + self._cache_misses
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'hit_rate': self._cache_hits / max(1, total_queries),
+            'build_time_per_op': dict(self._op_build_time),
+        }
+
+    def _build_placeholder_strategies(self, node, strategies_vector):
+        placeholder_handler = PlaceholderHandler(node,
+                                                 self.device_mesh,
+                                                 strategies_vector,
+                                                 placeholder_option=self._dataloader_option_name)
+        placeholder_handler.register_strategy()
+
+    def _build_getattr_strategies(self, node, strategies_vector):
+        getattr_handler = GetattrHandler(node,
+                                         self.device_mesh,
+                                         strategies_vector,
+                                         shard_option=self._shard_option,
+                                         solver_perference=self._solver_perference)
+        getattr_handler.register_strategy()
+
+    def _build_call_strategies(self, node, strategies_vector):
+        cache_key = self._strategy_cache_key(node)
+        if cache_key is not None and cache_key in self._strategy_cache:
+            # the strategies for a structurally identical node have been generated before,
+            # so we clone them and rebind them to the current node instead of dispatching
+            # to the handler again.
+            self._cache_hits += 1
+            self._rebind_cached_strategies(self._strategy_cache[cache_key], node, strategies_vector)
+        else:
+            self._cache_misses += 1
+            if node.op == 'call_module':
+                target = type(self._get_submodule(node.target))
+            elif node.op == 'call_function':
+                target = node.target
+            else:
+                target = getattr(node.args[0]._meta_data.__class__, node.target)
+            handler_cls = self._handler_cls_cache.get(target)
+            if handler_cls is None:
+                handler_cls = operator_registry.get(target)
+                self._handler_cls_cache[target] = handler_cls
+            handler = handler_cls(node,
+                                  self.device_mesh,
+                                  strategies_vector,
+                                  shard_option=self._shard_option,
+                                  solver_perference=self._solver_perference)
+            handler.register_strategy()
+            # attach metainfo_vector to node
+            if hasattr(handler, 'metainfo_vector'):
+                setattr(node, 'metainfo_vector', handler.metainfo_vector)
+                # the metainfo_vector refers to the strategies of this node, so the
+                # strategies cannot be shared with other nodes.
+            elif cache_key is not None:
+                self._strategy_cache[cache_key] = (list(strategies_vector), str(node),
+                                                   [str(pred) for pred in node._input_nodes.keys()])
+
+    def _build_output_strategies(self, node, strategies_vector):
+        output_handler = OutputHandler(node,
+                                       self.device_mesh,
+                                       strategies_vector,
+                                       output_option=self._dataloader_option_name)
+        output_handler.register_strategy()
 
     def remove_duplicated_strategy(self, strategies_vector):
         '''
@@ -49,118 +288,93 @@ class StrategiesConstructor:
         In this method, we will remove the duplicated strategies depending on the strategies name.
         Note that this operation is in-place.
         '''
-        name_checklist = []
-        remove_list = []
+        name_checklist = set()
+        kept_strategies = []
         for strategy in strategies_vector:
             if strategy.name not in name_checklist:
-                name_checklist.append(strategy.name)
-            else:
-                remove_list.append(strategy)
-        for strategy in remove_list:
-            strategies_vector.remove(strategy)
+                name_checklist.add(strategy.name)
+                kept_strategies.append(strategy)
+        strategies_vector[:] = kept_strategies
 
-    def build_strategies_and_cost(self):
-        """
-        This method is to build the strategy vector for each node in the computation graph.
-        """
+    def _check_no_strategy_for_node(self, node_op, node_meta):
+        if node_op in ('placeholder', 'get_attr', 'output'):
+            return False
 
-        def _check_no_strategy_for_node(node):
-            if node.op in ('placeholder', 'get_attr', 'output'):
+        def _check_no_strategy_for_data(data):
+            label = True
+            if isinstance(data, torch.Tensor):
                 return False
+            elif isinstance(data, (tuple, list)):
+                for d in data:
+                    label = label and _check_no_strategy_for_data(d)
+            return label
 
-            def _check_no_strategy_for_data(data):
-                label = True
-                if isinstance(data, torch.Tensor):
-                    return False
-                elif isinstance(data, (tuple, list)):
-                    for d in data:
-                        label = label and _check_no_strategy_for_data(d)
-                return label
+        return _check_no_strategy_for_data(node_meta)
 
-            return _check_no_strategy_for_data(node._meta_data)
+    def _process_node(self, index, node):
+        '''
+        Build, deduplicate and attach the strategies vector for a single node. The
+        strategies of all its predecessors must have been built before.
+        '''
+        node_op = self._node_ops[index]
+        strategies_vector = StrategiesVector(node)
 
-        for node in self.nodes:
-            strategies_vector = StrategiesVector(node)
+        no_strategy_node = self._check_no_strategy_for_node(node_op, self._node_meta[index])
+        if not no_strategy_node:
+            start_time = time.perf_counter()
+            self._op_dispatch[node_op](node, strategies_vector)
+            self._op_build_time[node_op] = self._op_build_time.get(node_op, 0.0) + time.perf_counter() - start_time
 
-            if _check_no_strategy_for_node(node):
-                self.no_strategy_nodes.append(node)
-                pass
-
-            # placeholder node
-            elif node.op == 'placeholder':
-                if self.solver_options.dataloader_option == DataloaderOption.DISTRIBUTED:
-                    placeholder_option = 'distributed'
-                else:
-                    assert self.solver_options.dataloader_option == DataloaderOption.REPLICATED, f'placeholder_option {self.solver_options.dataloader_option} is not supported'
-                    placeholder_option = 'replicated'
-                placeholder_handler = PlaceholderHandler(node,
-                                                         self.device_mesh,
-                                                         strategies_vector,
-                                                         placeholder_option=placeholder_option)
-                placeholder_handler.register_strategy()
-
-            # get_attr node
-            elif node.op == 'get_attr':
-                getattr_handler = GetattrHandler(node,
-                                                 self.device_mesh,
-                                                 strategies_vector,
-                                                 shard_option=self.solver_options.shard_option,
-                                                 solver_perference=self.solver_options.solver_perference)
-                getattr_handler.register_strategy()
+        self.remove_duplicated_strategy(strategies_vector)
+        setattr(node, 'strategies_vector', strategies_vector)
+        return strategies_vector, no_strategy_node
 
-            # call_module node
-            elif node.op == 'call_module':
-                target = node.target
-                submod = self.root_module.get_submodule(target)
-                submod_type = type(submod)
-                handler = operator_registry.get(submod_type)(node,
-                                                             self.device_mesh,
-                                                             strategies_vector,
-                                                             shard_option=self.solver_options.shard_option,
-                                                             solver_perference=self.solver_options.solver_perference)
-                handler.register_strategy()
-                # attach metainfo_vector to node
-                if hasattr(handler, 'metainfo_vector'):
-                    setattr(node, 'metainfo_vector', handler.metainfo_vector)
-
-            # call_function node
-            elif node.op == 'call_function':
-                target = node.target
-                handler = operator_registry.get(target)(node,
-                                                        self.device_mesh,
-                                                        strategies_vector,
-                                                        shard_option=self.solver_options.shard_option,
-                                                        solver_perference=self.solver_options.solver_perference)
-                handler.register_strategy()
-                # attach metainfo_vector to node
-                if hasattr(handler, 'metainfo_vector'):
-                    setattr(node, 'metainfo_vector', handler.metainfo_vector)
-
-            # call_method node
-            elif node.op == 'call_method':
-                method = getattr(node.args[0]._meta_data.__class__, node.target)
-                handler = operator_registry.get(method)(node,
-                                                        self.device_mesh,
-                                                        strategies_vector,
-                                                        shard_option=self.solver_options.shard_option,
-                                                        solver_perference=self.solver_options.solver_perference)
-                handler.register_strategy()
-                # attach metainfo_vector to node
-                if hasattr(handler, 'metainfo_vector'):
-                    setattr(node, 'metainfo_vector', handler.metainfo_vector)
-
-            # output node
-            elif node.op == 'output':
-                if self.solver_options.dataloader_option == DataloaderOption.DISTRIBUTED:
-                    output_option = 'distributed'
-                else:
-                    assert self.solver_options.dataloader_option == DataloaderOption.REPLICATED, f'placeholder_option {self.solver_options.dataloader_option} is not supported'
-                    output_option = 'replicated'
-                output_handler = OutputHandler(node, self.device_mesh, strategies_vector, output_option=output_option)
-                output_handler.register_strategy()
-
-            self.remove_duplicated_strategy(strategies_vector)
-            setattr(node, 'strategies_vector', strategies_vector)
+    def _build_strategies_concurrently(self, num_workers):
+        '''
+        Build the strategies level by level: the nodes within one topological level do
+        not depend on each other's strategies, so their handlers run on a thread pool.
+        '''
+        node_to_index = {node: index for index, node in enumerate(self.nodes)}
+        indegrees = {
+            node: sum(1 for pred in node.all_input_nodes if pred in node_to_index) for node in self.nodes
+        }
+        ready_nodes = [node for node in self.nodes if indegrees[node] == 0]
+        node_results = [None] * len(self.nodes)
+        num_processed = 0
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            while ready_nodes:
+                futures = [executor.submit(self._process_node, node_to_index[node], node) for node in ready_nodes]
+                for node, future in zip(ready_nodes, futures):
+                    node_results[node_to_index[node]] = future.result()
+                    num_processed += 1
+                next_ready_nodes = []
+                for node in ready_nodes:
+                    for user in node.users:
+                        if user in indegrees:
+                            indegrees[user] -= 1
+                            if indegrees[user] == 0:
+                                next_ready_nodes.append(user)
+                ready_nodes = next_ready_nodes
+        assert num_processed == len(self.nodes), 'some nodes are unreachable, the graph may contain a cycle'
+        return node_results
+
+    def build_strategies_and_cost(self, num_workers: int = 0):
+        """
+        This method is to build the strategy vector for each node in the computation graph.
+
+        Args:
+            num_workers (int): the number of threads used to build the strategies of
+                independent nodes concurrently. The default value 0 keeps the build
+                sequential.
+        """
+        if num_workers > 1:
+            node_results = self._build_strategies_concurrently(num_workers)
+        else:
+            node_results = [self._process_node(index, node) for index, node in enumerate(self.nodes)]
+
+        for node, (strategies_vector, no_strategy_node) in zip(self.nodes, node_results):
+            if no_strategy_node:
+                self.no_strategy_nodes.append(node)
             self.leaf_strategies.append(strategies_vector)
             self.strategy_map[node] = strategies_vector
 
@@ -12,6 +12,7 @@ from .sharding import (
     enumerate_all_possible_1d_sharding,
     enumerate_all_possible_2d_sharding,
     generate_sharding_size,
+    shallow_copy_dim_partition_dict,
     transpose_partition_dim,
     update_partition_dim,
 )
@@ -21,5 +22,6 @@ __all__ = [
     'generate_resharding_costs', 'generate_sharding_spec', 'ignore_sharding_exception', 'check_sharding_spec_validity'
     'transpose_partition_dim', 'update_partition_dim', 'enumerate_all_possible_1d_sharding',
     'enumerate_all_possible_2d_sharding', 'generate_sharding_size', 'comm_actions_for_oprands', 'pytree_map',
-    'detect_reshape_mapping', 'check_keep_sharding_status', 'infer_output_dim_partition_dict'
+    'detect_reshape_mapping', 'check_keep_sharding_status', 'infer_output_dim_partition_dict',
+    'shallow_copy_dim_partition_dict'
 ]
@@ -1,7 +1,7 @@
 import operator
 from copy import deepcopy
-from functools import reduce
-from typing import Dict
+from functools import lru_cache, reduce
+from typing import Dict, List
 
 import torch
 
@@ -9,10 +9,24 @@ from colossalai.tensor.sharding_spec import ShardingSpec
 
 __all__ = [
     'transpose_partition_dim', 'update_partition_dim', 'enumerate_all_possible_1d_sharding',
-    'enumerate_all_possible_2d_sharding', 'generate_sharding_size'
+    'enumerate_all_possible_2d_sharding', 'generate_sharding_size', 'shallow_copy_dim_partition_dict'
 ]
 
 
+def shallow_copy_dim_partition_dict(dim_partition_dict: Dict[int, List[int]]) -> Dict[int, List[int]]:
+    """
+    Copy a dim partition dict without the generic ``copy.deepcopy`` machinery.
+
+    The dict only maps tensor dimensions to lists of mesh dimensions, so copying the
+    lists directly is equivalent to a deepcopy while being much cheaper in the
+    strategy-generation hot loops.
+
+    Args:
+        dim_partition_dict (Dict[int, List[int]]): the dim partition dict to copy.
+    """
+    return {dim: shard_list[:] for dim, shard_list in dim_partition_dict.items()}
+
+
 def transpose_partition_dim(sharding_spec: ShardingSpec, dim1: int, dim2: int) -> ShardingSpec:
     """
     Switch the sharding mesh dimensions for two tensor dimensions. This operation is in-place.
@@ -84,30 +98,34 @@ def update_partition_dim(sharding_spec: ShardingSpec,
     return current_sharding_spec
 
 
+@lru_cache(maxsize=None)
+def _enumerate_sharding_dim_pairs(dim_size):
+    # the dim pairs only depend on the tensor rank, so they are cached across the
+    # many invocations issued while generating strategies
+    return tuple((i, j) for i in range(dim_size) for j in range(i + 1, dim_size))
+
+
 def enumerate_all_possible_2d_sharding(mesh_dim_0, mesh_dim_1, dim_size):
-    dim_partition_list = []
     # enumerate all the 2D sharding cases
-    for i in range(dim_size):
-        for j in range(i + 1, dim_size):
-            dim_partition_dict_0 = {i: [mesh_dim_0], j: [mesh_dim_1]}
-            dim_partition_dict_1 = {i: [mesh_dim_1], j: [mesh_dim_0]}
-            dim_partition_list.append(dim_partition_dict_0)
-            dim_partition_list.append(dim_partition_dict_1)
-    for i in range(dim_size):
-        dim_partition_dict_flatten = {i: [mesh_dim_0, mesh_dim_1]}
-        dim_partition_list.append(dim_partition_dict_flatten)
+    # the enumeration is bound by bytecode dispatch, so the dicts are built inside
+    # comprehensions to keep the loop bookkeeping in C
+    dim_partition_list = [
+        dim_partition_dict for i, j in _enumerate_sharding_dim_pairs(dim_size) for dim_partition_dict in ({
+            i: [mesh_dim_0],
+            j: [mesh_dim_1]
+        }, {
+            i: [mesh_dim_1],
+            j: [mesh_dim_0]
+        })
+    ]
+    dim_partition_list.extend({i: [mesh_dim_0, mesh_dim_1]} for i in range(dim_size))
 
     return dim_partition_list
 
 
 def enumerate_all_possible_1d_sharding(mesh_dim_0, dim_size):
-    dim_partition_list = []
     # enumerate all the 1D sharding cases
-    for i in range(dim_size):
-        dim_partition_dict_0 = {i: [mesh_dim_0]}
-        dim_partition_list.append(dim_partition_dict_0)
-
-    return dim_partition_list
+    return [{i: [mesh_dim_0]} for i in range(dim_size)]
 
 
 def generate_sharding_size(dim_partition_dict, device_mesh):
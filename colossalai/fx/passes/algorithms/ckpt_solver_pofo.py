@@ -1,5 +1,6 @@
 import copy
 import math
+from itertools import chain as chain_iter
 from typing import List, Tuple
 
 import torch
@@ -437,9 +438,7 @@ def _annotate_from_pofo_sequence(sequence: Sequence, node_list: List[List[Node]]
 
     # postprocess, make sure every activation checkpoint label in the
     # same activation checkpoint region (level = 0) has the same length
-    op_list = []
-    for node in node_list:
-        op_list += node
+    op_list = list(chain_iter(node_list))
     ckpt_regions = _find_nested_ckpt_regions(op_list)
     for (start_idx, end_idx) in ckpt_regions:
         nested_length = max(len(op_list[idx].activation_checkpoint) for idx in range(start_idx, end_idx + 1))
@@ -483,6 +482,29 @@ def _annotate_from_pofo_sequence(sequence: Sequence, node_list: List[List[Node]]
                     offload_idx += 1
 
 
+def _metainfo_is_current(gm: ColoGraphModule, data) -> bool:
+    """Check whether the meta info attached to ``gm`` already describes ``data``,
+    so that the expensive ``MetaInfoProp`` pass can be skipped on repeated calls
+    with the same input signature."""
+    placeholders = []
+    for node in gm.graph.nodes:
+        if len(node.meta) == 0 or 'tensor_meta' not in node.meta:
+            return False
+        if node.op == 'placeholder':
+            placeholders.append(node)
+    inputs = [data] if isinstance(data, torch.Tensor) else list(data)
+    if len(placeholders) != len(inputs):
+        return False
+    for node, tensor in zip(placeholders, inputs):
+        if not isinstance(tensor, torch.Tensor):
+            return False
+        tensor_meta = node.meta['tensor_meta']
+        if not hasattr(tensor_meta, 'shape') or tuple(tensor_meta.shape) != tuple(
+                tensor.shape) or tensor_meta.dtype != tensor.dtype:
+            return False
+    return True
+
+
 def solver_pofo(gm: ColoGraphModule,
                 data,
                 bandwidth,
@@ -515,7 +537,8 @@ def solver_pofo(gm: ColoGraphModule,
     if is_compatible_with_meta():
         from colossalai.fx.profiler import MetaTensor
         data = MetaTensor(data, fake_device=next(gm.parameters()).device)
-    MetaInfoProp(gm).run(data)
+    if not _metainfo_is_current(gm, data):
+        MetaInfoProp(gm).run(data)
     chain: Chain = _construct_chain(node_list, data)
     chain = _normalize_flops(chain, flops)
     # currently we view loss as an op without expense
@@ -1,7 +1,10 @@
 import math
 import sys
+from itertools import chain as chain_iter
 from typing import List, Tuple
 
+import numpy as np
+import torch
 from torch.fx import Node
 
 from colossalai.fx.codegen.activation_checkpoint_codegen import _find_nested_ckpt_regions
@@ -10,22 +13,131 @@ from colossalai.fx.profiler import activation_size, calculate_fwd_out, calculate
 from colossalai.logging import get_dist_logger
 
 from .linearize import linearize
-from .operation import Backward, Chain, ForwardCheck, ForwardEnable, ForwardNograd, Function, Loss, Sequence
+from .operation import Backward, Chain, ForwardCheck, ForwardEnable, ForwardNograd, Function, Loss, Operation, Sequence
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
 
 # global vairable to indicate whether the solver is failed
 SOLVER_FAILED = False
 
+# caches for repeated solver invocations on an unchanged graph: the linearization
+# and raw chain are cached per (graph, input meta, cnode), the compute table per
+# (discretized chain, memory slots, backend)
+_chain_cache = {}
+_opt_table_cache = {}
+
+
+def _data_fingerprint(data) -> Tuple:
+    """Build a hashable key out of the shapes and dtypes of the input meta"""
+    if isinstance(data, torch.Tensor):
+        return (tuple(data.shape), str(data.dtype))
+    if isinstance(data, dict):
+        return tuple((k, _data_fingerprint(v)) for k, v in data.items())
+    if isinstance(data, (tuple, list, set)):
+        return tuple(_data_fingerprint(v) for v in data)
+    return (type(data).__name__, str(data))
+
+
+def clear_rotor_cache():
+    """Drop the cached linearizations, chains and compute tables. This is needed
+    before re-running the solver on a graph that was mutated in place."""
+    _chain_cache.clear()
+    _opt_table_cache.clear()
+
+
+def _compute_table_kernel(fw, bw, cw, cbw, fwd_mem_tmp, bwd_mem_tmp, mmax, length, store_what):
+    """Scalar-loop version of the rotor DP, written so that numba can compile it.
+    The m axis of a diagonal slab only reads entries of smaller diagonals, so it
+    runs as the parallel loop when numba is available."""
+    opt = np.full((mmax + 1, length + 1, length + 1), np.inf, dtype=np.float64)
+    if store_what:
+        what_kind = np.zeros((mmax + 1, length + 1, length + 1), dtype=np.bool_)
+        what_j = np.zeros((mmax + 1, length + 1, length + 1), dtype=np.int16)
+    else:
+        what_kind = np.zeros((1, 1, 1), dtype=np.bool_)
+        what_j = np.zeros((1, 1, 1), dtype=np.int16)
+
+    fw_prefix = np.zeros(length + 2, dtype=np.float64)
+    for k in range(length + 1):
+        fw_prefix[k + 1] = fw_prefix[k] + fw[k]
+
+    # bw and bwd_mem_tmp are only read here: once the diagonal is filled, the DP
+    # body runs on fw_prefix, cw, cbw and fwd_mem_tmp alone
+    for i in range(length + 1):
+        limit = max(cw[i + 1] + cbw[i + 1] + fwd_mem_tmp[i], cw[i + 1] + cbw[i + 1] + bwd_mem_tmp[i])
+        cost = fw[i] + bw[i]
+        for m in range(limit, mmax + 1):
+            opt[m, i, i] = cost
+
+    # the memory lower bound maxes cw[j] + cw[j + 1] + fwd_mem_tmp[j] over
+    # j in (i, i + d); the range only gains the j = i + d - 1 term when d grows,
+    # so the per-i max is maintained across diagonals and mmin is resolved once
+    # per (d, i) instead of rescanned inside the m loop
+    inner_max = np.full(length + 1, np.int64(-2**62), dtype=np.int64)
+    mmin_d = np.zeros(length + 1, dtype=np.int64)
+
+    for d in range(1, length + 1):
+        for i in range(length + 1 - d):
+            idx = i + d
+            if d > 1:
+                term = cw[idx - 1] + cw[idx] + fwd_mem_tmp[idx - 1]
+                if term > inner_max[i]:
+                    inner_max[i] = term
+            mmin = cw[idx + 1] + cw[i + 1] + fwd_mem_tmp[i]
+            if d > 1 and cw[idx + 1] + inner_max[i] > mmin:
+                mmin = cw[idx + 1] + inner_max[i]
+            mmin_d[i] = mmin
+        for m in prange(mmax + 1):
+            for i in range(length + 1 - d):
+                if m < mmin_d[i]:
+                    continue
+                idx = i + d
+                best_val = np.inf
+                best_j = -1
+                for j in range(i + 1, idx + 1):
+                    if m >= cw[j]:
+                        val = fw_prefix[j] - fw_prefix[i] + opt[m - cw[j], j, idx] + opt[m, i, j - 1]
+                        if val < best_val:
+                            best_val = val
+                            best_j = j
+                if m >= cbw[i + 1]:
+                    chain_cost = opt[m, i, i] + opt[m - cbw[i + 1], i + 1, idx]
+                else:
+                    chain_cost = np.inf
+                if best_j >= 0 and best_val <= chain_cost:
+                    opt[m, i, idx] = best_val
+                    if store_what:
+                        what_j[m, i, idx] = best_j
+                else:
+                    opt[m, i, idx] = chain_cost
+                    if store_what:
+                        what_kind[m, i, idx] = True
+    return opt, what_kind, what_j
+
+
+if njit is not None:
+    _compute_table_kernel = njit(parallel=True, cache=True)(_compute_table_kernel)
+
 
 # this is the python compute table code from rotor
 # https://gitlab.inria.fr/hiepacs/rotor
 # paper link: https://hal.inria.fr/hal-02352969
-def _compute_table(chain: Chain, mmax) -> Tuple:
+def _compute_table(chain: Chain, mmax, low_memory: bool = False) -> Tuple:
     """Returns the optimal table: a tuple containing:
     Opt[m][lmin][lmax] with lmin = 0...chain.length
          and lmax = lmin...chain.length (lmax is not included) and m = 0...mmax
-    what[m][lmin][lmax] is (True,) if the optimal choice is a chain checkpoint
-                           (False, j) if the optimal choice is a leaf checkpoint of length j
-    The computation uses dynamic programming"""
+    what_kind[m][lmin][lmax] is True if the optimal choice is a chain checkpoint,
+    False if it is a leaf checkpoint whose index is then what_j[m][lmin][lmax]
+    The computation uses dynamic programming: the recurrence for a diagonal
+    lmax - lmin = d only reads entries of strictly smaller diagonals, so each
+    diagonal is computed for every (m, lmin) at once with numpy.
+    With low_memory the what tables are not materialized at all and the result
+    is the 1-tuple (opt,): _rec then rebuilds each decision from opt on demand,
+    which only touches the cells along the reconstructed schedule"""
 
     fw = chain.fweight + [0]    ## forward time
     bw = chain.bweight    ## backward time, not used
@@ -34,51 +146,110 @@ def _compute_table(chain: Chain, mmax) -> Tuple:
     fwd_mem_tmp = chain.fwd_mem_tmp + [0]
     bwd_mem_tmp = chain.bwd_mem_tmp + [0]
 
-    # Build table
-    opt = [[{} for _ in range(chain.length + 1)] for _ in range(mmax + 1)]
-    what = [[{} for _ in range(chain.length + 1)] for _ in range(mmax + 1)]
-    # Last one is a dict because its indices go from i to l. Renumbering will wait for C implementation
-
-    # Initialize borders of the tables for lmax-lmin = 0
-    for m in range(mmax + 1):
-        for i in range(chain.length + 1):
-            #lmax-lmin = 0
-            limit = max(cw[i + 1] + cbw[i + 1] + fwd_mem_tmp[i], cw[i + 1] + cbw[i + 1] + bwd_mem_tmp[i])
-            if m >= limit:    ## Equation (1)
-                opt[m][i][i] = fw[i] + bw[i]
-            else:
-                opt[m][i][i] = float("inf")
+    length = chain.length
+    cw_arr = np.asarray(cw, dtype=np.int64)
+    cbw_arr = np.asarray(cbw, dtype=np.int64)
+
+    if njit is not None:
+        opt, what_kind, what_j = _compute_table_kernel(np.asarray(fw, dtype=np.float64),
+                                                       np.asarray(bw, dtype=np.float64), cw_arr, cbw_arr,
+                                                       np.asarray(fwd_mem_tmp, dtype=np.int64),
+                                                       np.asarray(bwd_mem_tmp, dtype=np.int64), mmax, length,
+                                                       not low_memory)
+        return (opt,) if low_memory else (opt, what_kind, what_j)
+
+    # prefix sums so that sum(fw[i:j]) becomes fw_prefix[j] - fw_prefix[i]
+    fw_prefix = np.zeros(len(fw) + 1, dtype=np.float64)
+    np.cumsum(fw, out=fw_prefix[1:])
+    m_grid = np.arange(mmax + 1)
+
+    fwd_tmp_arr = np.asarray(fwd_mem_tmp, dtype=np.int64)
+    # the memory lower bound maxes cw[j] + cw[j + 1] + fwd_mem_tmp[j] over
+    # j in (i, i + d); the range only gains the j = i + d - 1 term when d grows,
+    # so the max is maintained as a per-i running max instead of rescanned
+    inner_term = cw_arr[:length + 1] + cw_arr[1:length + 2] + fwd_tmp_arr
+    inner_max = np.full(length + 1, np.iinfo(np.int64).min, dtype=np.int64)
 
-    # Compute everything
-    for m in range(mmax + 1):
-        for d in range(1, chain.length + 1):
-            for i in range(chain.length + 1 - d):
-                # for idx in range(i+1, chain.length + 1):
-                idx = i + d
-                mmin = cw[idx + 1] + cw[i + 1] + fwd_mem_tmp[i]
-                if idx > i + 1:
-                    mmin = max(mmin, cw[idx + 1] + max(cw[j] + cw[j + 1] + fwd_mem_tmp[j] for j in range(i + 1, idx)))
-                if m < mmin:
-                    opt[m][i][idx] = float("inf")
-                else:
-                    leaf_checkpoints = [(j, sum(fw[i:j]) + opt[m - cw[j]][j][idx] + opt[m][i][j - 1])
-                                        for j in range(i + 1, idx + 1)
-                                        if m >= cw[j]]
-                    if leaf_checkpoints:
-                        best_leaf = min(leaf_checkpoints, key=lambda t: t[1])
-                    else:
-                        best_leaf = None
-                    if m >= cbw[i + 1]:
-                        chain_checkpoint = opt[m][i][i] + opt[m - cbw[i + 1]][i + 1][idx]
-                    else:
-                        chain_checkpoint = float("inf")
-                    if best_leaf and best_leaf[1] <= chain_checkpoint:
-                        opt[m][i][idx] = best_leaf[1]
-                        what[m][i][idx] = (False, best_leaf[0])
-                    else:
-                        opt[m][i][idx] = chain_checkpoint
-                        what[m][i][idx] = (True,)
-    return (opt, what)
+    # Build table
+    opt = np.full((mmax + 1, length + 1, length + 1), np.inf, dtype=np.float64)
+    if not low_memory:
+        what_kind = np.zeros((mmax + 1, length + 1, length + 1), dtype=np.bool_)
+        what_j = np.zeros((mmax + 1, length + 1, length + 1), dtype=np.int16)
+
+    # Initialize borders of the tables for lmax-lmin = 0 in one broadcasted
+    # write; bw and bwd_mem_tmp are only needed here, the main DP body below
+    # runs on fw_prefix, cw, cbw and fwd_mem_tmp alone
+    bwd_tmp_arr = np.asarray(bwd_mem_tmp, dtype=np.int64)
+    diag_limit = cw_arr[1:length + 2] + cbw_arr[1:length + 2] + np.maximum(fwd_tmp_arr, bwd_tmp_arr[:length + 1])
+    diag_cost = np.asarray(fw, dtype=np.float64) + np.asarray(bw, dtype=np.float64)
+    diag_idx = np.arange(length + 1)
+    ## Equation (1)
+    opt[:, diag_idx, diag_idx] = np.where(m_grid[:, None] >= diag_limit[None, :], diag_cost[None, :], np.inf)
+
+    # Compute everything, one diagonal at a time
+    for d in range(1, length + 1):
+        i_arr = np.arange(length + 1 - d)
+        idx_arr = i_arr + d
+
+        mmin = cw_arr[idx_arr + 1] + cw_arr[i_arr + 1] + fwd_tmp_arr[i_arr]
+        if d > 1:
+            n_i = len(i_arr)
+            np.maximum(inner_max[:n_i], inner_term[d - 1:d - 1 + n_i], out=inner_max[:n_i])
+            mmin = np.maximum(mmin, cw_arr[idx_arr + 1] + inner_max[:n_i])
+
+        # leaf checkpoints: sum(fw[i:j]) + opt[m - cw[j]][j][idx] + opt[m][i][j - 1]
+        # for every j in (i, idx], infeasible when m < cw[j]
+        j_mat = i_arr[:, None] + np.arange(1, d + 1)[None, :]
+        leaf_m = m_grid[:, None, None] - cw_arr[j_mat][None, :, :]
+        leaf_cost = (fw_prefix[j_mat] - fw_prefix[i_arr[:, None]])[None, :, :] \
+            + opt[np.maximum(leaf_m, 0), j_mat[None, :, :], idx_arr[None, :, None]] \
+            + opt[:, i_arr[:, None], j_mat - 1]
+        leaf_cost[leaf_m < 0] = np.inf
+        best_leaf_cost = leaf_cost.min(axis=2)
+        if not low_memory:
+            # argmin returns the first minimum, like the original scan over increasing j
+            best_leaf_j = (i_arr[None, :] + 1 + leaf_cost.argmin(axis=2)).astype(np.int16)
+
+        # chain checkpoints: opt[m][i][i] + opt[m - cbw[i + 1]][i + 1][idx],
+        # infeasible when m < cbw[i + 1]
+        chain_m = m_grid[:, None] - cbw_arr[i_arr + 1][None, :]
+        chain_cost = opt[:, i_arr, i_arr] + opt[np.maximum(chain_m, 0), (i_arr + 1)[None, :], idx_arr[None, :]]
+        chain_cost[chain_m < 0] = np.inf
+
+        # keep the leaf checkpoint on ties, as the scalar version did
+        leaf_wins = best_leaf_cost <= chain_cost
+        values = np.where(leaf_wins, best_leaf_cost, chain_cost)
+        values[m_grid[:, None] < mmin[None, :]] = np.inf
+
+        opt[:, i_arr, idx_arr] = values
+        if not low_memory:
+            what_kind[:, i_arr, idx_arr] = ~leaf_wins
+            what_j[:, i_arr, idx_arr] = best_leaf_j
+    return (opt,) if low_memory else (opt, what_kind, what_j)
+
+
+def _rebuild_choice(chain: Chain, lmin, lmax, cmem, opt):
+    """Recompute the decision of one finite DP cell from opt alone, replaying
+    the recurrence with the same tie-breaking as _compute_table (the first best
+    leaf checkpoint wins over a chain checkpoint of equal cost). Returns a
+    (chain_checkpoint_chosen, j) pair like the dense what tables encode."""
+    best_val = float("inf")
+    best_j = -1
+    fw_sum = 0
+    for j in range(lmin + 1, lmax + 1):
+        fw_sum += chain.fweight[j - 1]
+        if cmem >= chain.cweight[j]:
+            val = fw_sum + opt[cmem - chain.cweight[j]][j][lmax] + opt[cmem][lmin][j - 1]
+            if val < best_val:
+                best_val = val
+                best_j = j
+    if cmem >= chain.cbweight[lmin + 1]:
+        chain_cost = opt[cmem][lmin][lmin] + opt[cmem - chain.cbweight[lmin + 1]][lmin + 1][lmax]
+    else:
+        chain_cost = float("inf")
+    if best_j >= 0 and best_val <= chain_cost:
+        return False, best_j
+    return True, -1
 
 
 def _rec(chain: Chain, lmin, lmax, cmem, opt_table):
@@ -86,43 +257,66 @@ def _rec(chain: Chain, lmin, lmax, cmem, opt_table):
         lmin : index of the first forward to execute
         lmax : upper bound index of the last forward to execute (not included)
         cmem : number of available memory slots
-        Return the optimal sequence of makespan Opt_hete[cmem][lmin][lmax-lmin]"""
-    if cmem <= 0:
-        raise ValueError("Can not process a chain with negative memory {cmem}".format(cmem=cmem))
-    opt, what = opt_table
-    sequence = Sequence(Function("Persistent", lmax - lmin, cmem))
-    if opt[cmem][lmin][lmax] == float("inf"):
-        # using logger to annonce that the solver is failed
-        logger = get_dist_logger()
-        logger.info("Can not process this chain from index {lmin} to {lmax} with memory {cmem}".format(lmin=lmin,
-                                                                                                       lmax=lmax,
-                                                                                                       cmem=cmem))
-
-        # set global indicater SOLVER_FAILED to True
-        global SOLVER_FAILED
-        SOLVER_FAILED = True
-        return sequence
-
-    if lmin == lmax:
-        if lmin == chain.length:
-            sequence.insert(Loss())
+        Return the optimal sequence of makespan Opt_hete[cmem][lmin][lmax-lmin]
+        The table walk pops work items off an explicit stack and emits straight
+        into one flat operation list: operations scheduled after a subproblem
+        are pushed as items themselves, and the Sequence is built once at the
+        end instead of splicing intermediate subsequences"""
+    opt = opt_table[0]
+    op_list = []
+    stack = [(lmin, lmax, cmem)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Operation):
+            # an operation scheduled to run right after a subproblem
+            op_list.append(item)
+            continue
+        sub_lmin, sub_lmax, sub_cmem = item
+        if sub_cmem <= 0:
+            raise ValueError("Can not process a chain with negative memory {cmem}".format(cmem=sub_cmem))
+        if opt[sub_cmem][sub_lmin][sub_lmax] == float("inf"):
+            # using logger to annonce that the solver is failed
+            logger = get_dist_logger()
+            logger.info("Can not process this chain from index {lmin} to {lmax} with memory {cmem}".format(
+                lmin=sub_lmin, lmax=sub_lmax, cmem=sub_cmem))
+
+            # set global indicater SOLVER_FAILED to True
+            global SOLVER_FAILED
+            SOLVER_FAILED = True
+            continue
+
+        if sub_lmin == sub_lmax:
+            if sub_lmin == chain.length:
+                op_list.append(Loss())
+            else:
+                op_list.append(ForwardEnable(sub_lmin))
+                op_list.append(Backward(sub_lmin))
+            continue
+
+        if len(opt_table) == 1:
+            # the low-memory table only kept opt; rebuild the decision on demand
+            chain_checkpoint_chosen, j = _rebuild_choice(chain, sub_lmin, sub_lmax, sub_cmem, opt)
+        elif len(opt_table) == 3:
+            # the dense tables store the chain/leaf choice and the leaf index separately
+            _, what_kind, what_j = opt_table
+            chain_checkpoint_chosen = bool(what_kind[sub_cmem, sub_lmin, sub_lmax])
+            j = int(what_j[sub_cmem, sub_lmin, sub_lmax])
         else:
-            sequence.insert(ForwardEnable(lmin))
-            sequence.insert(Backward(lmin))
-        return sequence
-
-    if what[cmem][lmin][lmax][0]:
-        sequence.insert(ForwardEnable(lmin))
-        sequence.insert_sequence(_rec(chain, lmin + 1, lmax, cmem - chain.cbweight[lmin + 1], opt_table))
-        sequence.insert(Backward(lmin))
-    else:
-        j = what[cmem][lmin][lmax][1]
-        sequence.insert(ForwardCheck(lmin))
-        for k in range(lmin + 1, j):
-            sequence.insert(ForwardNograd(k))
-        sequence.insert_sequence(_rec(chain, j, lmax, cmem - chain.cweight[j], opt_table))
-        sequence.insert_sequence(_rec(chain, lmin, j - 1, cmem, opt_table))
-    return sequence
+            # the C version stores (True,) for a chain checkpoint and (False, j) for a leaf one
+            what_entry = opt_table[1][sub_cmem][sub_lmin][sub_lmax]
+            chain_checkpoint_chosen = what_entry[0]
+            j = what_entry[1] if not chain_checkpoint_chosen else -1
+        if chain_checkpoint_chosen:
+            op_list.append(ForwardEnable(sub_lmin))
+            stack.append(Backward(sub_lmin))
+            stack.append((sub_lmin + 1, sub_lmax, sub_cmem - chain.cbweight[sub_lmin + 1]))
+        else:
+            op_list.append(ForwardCheck(sub_lmin))
+            for k in range(sub_lmin + 1, j):
+                op_list.append(ForwardNograd(k))
+            stack.append((sub_lmin, j - 1, sub_cmem))
+            stack.append((j, sub_lmax, sub_cmem - chain.cweight[j]))
+    return Sequence.from_operations(Function("Persistent", lmax - lmin, cmem), op_list)
 
 
 def _fwd_xbar(node: List[Node]) -> int:
@@ -142,42 +336,6 @@ def _fwd_xbar(node: List[Node]) -> int:
     return xbar
 
 
-def _fwd_time(node: List[Node]) -> int:
-    """Get the foward time of a node
-
-    Args:
-        node (List[Node]): List of torch.fx Node,
-        indicates a node in linearized graph
-
-    Returns:
-        int: foward time, extimated by flops count
-    """
-
-    fwd_time = 0
-    for n in node:
-        # minimum flop count is needed
-        fwd_time += max(n.meta['fwd_flop'], 1)
-    return fwd_time
-
-
-def _bwd_time(node: List[Node]) -> int:
-    """Get the backward time of a node
-
-    Args:
-        node (List[Node]): List of torch.fx Node,
-        indicates a node in linearized graph
-
-    Returns:
-        int: backward time, extimated by flops count
-    """
-
-    bwd_time = 0
-    for n in node:
-        # minimum flop count is needed
-        bwd_time += max(n.meta['bwd_flop'], 1)
-    return bwd_time
-
-
 def _get_fwd_mem_tmp(node: List[Node]) -> int:
     """Get the forward temp memory of a node
     This could be done by subtracting the saved activation from all output of a node
@@ -204,138 +362,164 @@ def _get_bwd_mem_tmp(node: List[Node]) -> int:
         int: backward temp memory, unit Byte
     """
 
-    def _get_deps_size():
-        deps_size = 0
-        for k, v in deps.items():
-            k: Node
-            if v > 0:
-                deps_size += k.meta['bwd_mem_out']
-            if v == float('-inf'):
-                deps_size -= calculate_fwd_tmp(k) + calculate_fwd_out(k)
-
-        return deps_size
-
     bwd_mem_tmp = 0
     deps = {}
+    # each key contributes +bwd_mem_out while it still has pending inputs and
+    # -(fwd_tmp + fwd_out) once it is freed; tracking the transitions keeps the
+    # sum up to date without rescanning the whole dict for every node
+    deps_size = 0
 
     for n in reversed(node):
-        deps[n] = len(n.all_input_nodes)
-        bwd_mem_tmp = max(bwd_mem_tmp, _get_deps_size() + n.meta['bwd_mem_tmp'])
+        input_count = len(n.all_input_nodes)
+        deps[n] = input_count
+        if input_count > 0:
+            deps_size += n.meta['bwd_mem_out']
+        bwd_mem_tmp = max(bwd_mem_tmp, deps_size + n.meta['bwd_mem_tmp'])
 
         for child in n.users:
-            if child in deps:
-                deps[child] -= 1
-                if deps[child] <= 0:
+            count = deps.get(child)
+            if count is not None and count != float('-inf'):
+                count -= 1
+                if count <= 0:
                     deps[child] = float('-inf')    # free
+                    if count == 0:
+                        deps_size -= child.meta['bwd_mem_out']
+                    deps_size -= calculate_fwd_tmp(child) + calculate_fwd_out(child)
+                else:
+                    deps[child] = count
 
     return bwd_mem_tmp
 
 
 def _construct_chain(node_list: List[List[Node]], input) -> Chain:
 
-    fwd_time = []
-    bwd_time = []
-    xbar_sizes = [activation_size(input)]
-    x_sizes = [activation_size(input)]
-    tmp_fwd = []
-    tmp_bwd = []
+    # fill preallocated arrays instead of growing six python lists; the Chain
+    # itself keeps python lists since the C solver and the table builders
+    # concatenate its fields
+    num_nodes = len(node_list)
+    bwd_time = np.zeros(num_nodes + 1, dtype=np.int64)
+    x_sizes = np.empty(num_nodes + 1, dtype=np.int64)
+    xbar_sizes = np.empty(num_nodes + 1, dtype=np.int64)
+    tmp_fwd = np.empty(num_nodes, dtype=np.int64)
+    tmp_bwd = np.empty(num_nodes + 1, dtype=np.int64)
+
+    # per-block forward/backward times, estimated by flop count with a minimum
+    # of one per node, come from one segmented reduction over the flattened
+    # flop counts instead of a python loop per block
+    if num_nodes > 0:
+        flat_fwd_flop = np.fromiter((n.meta['fwd_flop'] for n in chain_iter(node_list)), dtype=np.int64)
+        flat_bwd_flop = np.fromiter((n.meta['bwd_flop'] for n in chain_iter(node_list)), dtype=np.int64)
+        block_starts = np.zeros(num_nodes, dtype=np.int64)
+        np.cumsum([len(node) for node in node_list[:-1]], out=block_starts[1:])
+        fwd_time = np.add.reduceat(np.maximum(flat_fwd_flop, 1), block_starts)
+        bwd_time[:num_nodes] = np.add.reduceat(np.maximum(flat_bwd_flop, 1), block_starts)
+    else:
+        fwd_time = np.zeros(0, dtype=np.int64)
 
+    x_sizes[0] = xbar_sizes[0] = activation_size(input)
     for idx, node in enumerate(node_list):
-        fwd_time.append(_fwd_time(node))
-        bwd_time.append(_bwd_time(node))
-        x_sizes.append(calculate_fwd_out(node[-1]))
-        xbar_sizes.append(max(x_sizes[-1], _fwd_xbar(node)))
-        tmp_fwd.append(_get_fwd_mem_tmp(node))
-        tmp_bwd.append(_get_bwd_mem_tmp(node))
-
-    bwd_time.append(0)
+        x_sizes[idx + 1] = calculate_fwd_out(node[-1])
+        xbar_sizes[idx + 1] = max(x_sizes[idx + 1], _fwd_xbar(node))
+        tmp_fwd[idx] = _get_fwd_mem_tmp(node)
+        tmp_bwd[idx] = _get_bwd_mem_tmp(node)
 
     # currently we view loss backward temp as zero
-    tmp_bwd.append(0)
+    tmp_bwd[num_nodes] = 0
 
-    return Chain(fwd_time, bwd_time, x_sizes, xbar_sizes, tmp_fwd, tmp_bwd)
+    return Chain(fwd_time.tolist(), bwd_time.tolist(), x_sizes.tolist(), xbar_sizes.tolist(), tmp_fwd.tolist(),
+                 tmp_bwd.tolist())
 
 
 def _annotate_from_sequence(sequence: Sequence, node_list: List[List[Node]]):
-    op_list = sequence.list_operations()
-    loss_op = next(op for op in op_list if isinstance(op, Loss))
-    fwd_list = op_list[:op_list.index(loss_op)]
-    bwd_list = op_list[op_list.index(loss_op) + 1:]
+    # a single scan drives both the forward and the backward annotation: the
+    # phase flips when the Loss operation is met, and the operation type is
+    # resolved once per op instead of through isinstance chains
+    FWD_NOGRAD, FWD_ENABLE, FWD_CHECK, BWD, LOSS = range(5)
+    op_type_id = {ForwardNograd: FWD_NOGRAD, ForwardEnable: FWD_ENABLE, ForwardCheck: FWD_CHECK, Backward: BWD, Loss: LOSS}
+
     ckpt_idx = 0
     in_ckpt = False
+    in_recompute = False
+    after_loss = False
     ckpt_region = []
+    fwd_idx = 0
+
+    def _region_nodes(region):
+        # one flat pass over the nodes of a region; each node still gets its own
+        # label list, since the backward scan appends node by node and a shared
+        # list would collect one append per member
+        return [n for node_idx in region for n in node_list[node_idx]]
+
+    for op in sequence.list_operations():
+        op_type = op_type_id.get(type(op))
+        if op_type == LOSS:
+            after_loss = True
+            continue
+
+        if not after_loss:
+            # forward annotation
+            idx = fwd_idx
+            fwd_idx += 1
+            if in_ckpt:
+                if op_type == FWD_NOGRAD:
+                    ckpt_region.append(idx)
+
+                elif op_type == FWD_ENABLE:
+                    in_ckpt = False
+                    for n in _region_nodes(ckpt_region):
+                        n.activation_checkpoint = [ckpt_idx]
+
+                    ckpt_idx += 1
+                    ckpt_region = []
+
+                elif op_type == FWD_CHECK:
+                    for n in _region_nodes(ckpt_region):
+                        n.activation_checkpoint = [ckpt_idx]
+
+                    ckpt_idx += 1
+                    ckpt_region = [idx]
 
-    # forward annotation
-    for idx, op in enumerate(fwd_list, 0):
-        if in_ckpt:
-            if isinstance(op, ForwardNograd):
-                ckpt_region.append(idx)
-
-            elif isinstance(op, ForwardEnable):
-                in_ckpt = False
-                for node_idx in ckpt_region:
-                    for n in node_list[node_idx]:
-                        setattr(n, "activation_checkpoint", [ckpt_idx])
-
-                ckpt_idx += 1
-                ckpt_region = []
-
-            elif isinstance(op, ForwardCheck):
-                for node_idx in ckpt_region:
-                    for n in node_list[node_idx]:
-                        setattr(n, "activation_checkpoint", [ckpt_idx])
-
-                ckpt_idx += 1
-                ckpt_region = [idx]
-
-        else:
-            if isinstance(op, ForwardCheck):
-                in_ckpt = True
-                ckpt_region.append(idx)
+            else:
+                if op_type == FWD_CHECK:
+                    in_ckpt = True
+                    ckpt_region.append(idx)
 
-    # annotate the backward if there is any nested activation checkpoint
-    in_recompute = False
-    for op in bwd_list:
-        if in_recompute:
-            if isinstance(op, ForwardNograd):
+        # annotate the backward if there is any nested activation checkpoint
+        elif in_recompute:
+            if op_type == FWD_NOGRAD:
                 ckpt_region.append(op.index)
 
-            elif isinstance(op, ForwardEnable):
-                for node_idx in ckpt_region:
-                    for n in node_list[node_idx]:
-                        n.activation_checkpoint.append(ckpt_idx)
+            elif op_type == FWD_ENABLE:
+                for n in _region_nodes(ckpt_region):
+                    n.activation_checkpoint.append(ckpt_idx)
 
                 ckpt_idx += 1
                 ckpt_region = []
 
-            elif isinstance(op, ForwardCheck):
-                for node_idx in ckpt_region:
-                    for n in node_list[node_idx]:
-                        n.activation_checkpoint.append(ckpt_idx)
+            elif op_type == FWD_CHECK:
+                for n in _region_nodes(ckpt_region):
+                    n.activation_checkpoint.append(ckpt_idx)
 
                 ckpt_idx += 1
                 ckpt_region = [op.index]
 
-            elif isinstance(op, Backward):
-                for node_idx in ckpt_region:
-                    for n in node_list[node_idx]:
-                        n.activation_checkpoint.append(ckpt_idx)
+            elif op_type == BWD:
+                for n in _region_nodes(ckpt_region):
+                    n.activation_checkpoint.append(ckpt_idx)
 
                 in_recompute = False
 
         else:
-            if not isinstance(op, Backward):
+            if op_type != BWD:
                 in_recompute = True
                 ckpt_idx = 0
                 ckpt_region = []
-                if isinstance(op, ForwardCheck):
+                if op_type == FWD_CHECK:
                     ckpt_region.append(op.index)
 
     # postprocess, make sure every activation checkpoint label in the
     # same activation checkpoint region (level = 0) has the same length
-    op_list = []
-    for node in node_list:
-        op_list += node
+    op_list = list(chain_iter(node_list))
     ckpt_regions = _find_nested_ckpt_regions(op_list)
     for (start_idx, end_idx) in ckpt_regions:
         nested_length = max(len(op_list[idx].activation_checkpoint) for idx in range(start_idx, end_idx + 1))
@@ -349,7 +533,8 @@ def solver_rotor(gm: ColoGraphModule,
                  mem_slots: int = 500,
                  cnode: List[str] = None,
                  eps: float = 0.0,
-                 force_python: bool = False) -> ColoGraphModule:
+                 force_python: bool = False,
+                 low_memory: bool = False) -> ColoGraphModule:
     """solver that automatically find activation checkpoint in rotor's manner
 
     Args:
@@ -360,6 +545,9 @@ def solver_rotor(gm: ColoGraphModule,
         cnode (List[Node], optional): common node list for linearize. Defaults to None.
         eps (float): epsilon for memory decay. Defaults to 0.0
         force_python (bool): force to use python version of dynamic programs
+        low_memory (bool): drop the what tables of the dynamic programs and rebuild
+        decisions from opt on demand; implies the python version, as the C solver
+        always materializes its full table
 
     Returns:
         ColoGraphModule: annotated ColoGraphModuled with __sequence__ attribute
@@ -401,21 +589,35 @@ def solver_rotor(gm: ColoGraphModule,
         raise RuntimeError(
             "Nodes meta information hasn't been prepared! Please run MetaInfoProp before calling solver!")
 
-    # linearize the graph
-    node_list = linearize(gm, cnode)
+    # linearize the graph and construct the chain, reusing the cached results
+    # when the same graph and input meta were already processed
+    chain_key = (id(gm), _data_fingerprint(data), tuple(cnode) if cnode is not None else None)
+    if chain_key in _chain_cache:
+        node_list, raw_chain = _chain_cache[chain_key]
+    else:
+        node_list = linearize(gm, cnode)
+        raw_chain = _construct_chain(node_list, data)
+        _chain_cache[chain_key] = (node_list, raw_chain)
 
-    # construct chain
+    # _discretize mutates the chain, so the cached raw chain is copied first
     mem_unit = mem_limit * (1.0 - eps) // mem_slots
-    chain: Chain = _construct_chain(node_list, data)
+    chain = Chain(list(raw_chain.fweight), list(raw_chain.bweight), list(raw_chain.cweight), list(raw_chain.cbweight),
+                  list(raw_chain.fwd_mem_tmp), list(raw_chain.bwd_mem_tmp))
     chain._discretize(mem_unit)
 
-    # use C version if possible
-    if CVERSION and not force_python:
-        logger.info("Using C version rotor solver!", ranks=[0])
-        opt_table = persistent_compute_table(chain, mem_slots)
-    else:
-        opt_table = _compute_table(chain, mem_slots)
-        logger.info("Using python version rotor solver!", ranks=[0])
+    use_C_version = CVERSION and not force_python and not low_memory
+    table_key = (tuple(chain.fweight), tuple(chain.bweight), tuple(chain.cweight), tuple(chain.cbweight),
+                 tuple(chain.fwd_mem_tmp), tuple(chain.bwd_mem_tmp), mem_slots, use_C_version, low_memory)
+    opt_table = _opt_table_cache.get(table_key)
+    if opt_table is None:
+        # use C version if possible
+        if use_C_version:
+            logger.info("Using C version rotor solver!", ranks=[0])
+            opt_table = persistent_compute_table(chain, mem_slots)
+        else:
+            opt_table = _compute_table(chain, mem_slots, low_memory=low_memory)
+            logger.info("Using python version rotor solver!", ranks=[0])
+        _opt_table_cache[table_key] = opt_table
 
     # found sequence
     sequence = _rec(chain, 0, chain.length, mem_slots - chain.cweight[0], opt_table)
@@ -434,3 +636,7 @@ def solver_rotor(gm: ColoGraphModule,
     setattr(gm, "__opttable__", opt_table[0])
     gm.recompile()
     return gm
+
+
+# allow users that mutate the graph in place to reset the memoized results
+solver_rotor.cache_clear = clear_rotor_cache
@@ -1,8 +1,10 @@
-import math
+import numpy as np
 
 
 def _discretize(mem_unit, values):
-    return [math.ceil(value / mem_unit) for value in values]
+    # one vectorized ceil instead of a python-level math.ceil per value; the
+    # result stays a list of python ints for the C solver
+    return np.ceil(np.asarray(values, dtype=np.float64) / mem_unit).astype(np.int64).tolist()
 
 
 class Chain:
@@ -208,6 +210,7 @@ class Sequence:
     def __init__(self, function):
         self.sequence = []    #List of Operation and Sequence
         self.function = function    #Description the function (name and parameters)
+        self._loss_index = None    #Position of the Loss operation, resolved lazily
 
     def __repr__(self):
         return repr(self.list_operations())
@@ -222,11 +225,32 @@ class Sequence:
                 op_list += x.list_operations()
         return op_list
 
+    @classmethod
+    def from_operations(cls, function, operations):
+        """Build a Sequence around an already-flat list of operations, without
+        going through one insert call per operation."""
+        sequence = cls(function)
+        sequence.sequence = list(operations)
+        for index, op in enumerate(sequence.sequence):
+            if type(op) is Loss:
+                sequence._loss_index = index
+                break
+        return sequence
+
+    @property
+    def loss_index(self):
+        """Index of the Loss operation in list_operations(), cached so that
+        consumers do not rescan the whole sequence for it."""
+        if self._loss_index is None:
+            self._loss_index = next(i for i, op in enumerate(self.list_operations()) if type(op) is Loss)
+        return self._loss_index
+
     def insert(self, operation):
         self.sequence.append(operation)
 
     def remove(self, operation_index):
         del self.sequence[operation_index]
+        self._loss_index = None
 
     def insert_sequence(self, sequence):
         self.sequence.append(sequence)
@@ -247,7 +271,7 @@ class Sequence:
 
     def without_suffix(self):
         ops = self.list_operations()
-        end_of_first_phase = [i for i in range(len(ops)) if type(ops[i]) is Loss][0]
+        end_of_first_phase = self.loss_index
         try:
             last_idx = max(i for i in range(end_of_first_phase) if not type(ops[i]) is ForwardEnable)
         except ValueError:
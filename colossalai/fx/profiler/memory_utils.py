@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, List, Tuple, Union
 
 import torch
@@ -8,6 +9,15 @@ from .._compatibility import compatibility, is_compatible_with_meta
 __all__ = ['activation_size', 'parameter_size', 'is_inplace']
 
 
+@lru_cache(maxsize=None)
+def _element_size(dtype: torch.dtype, is_quantized: bool = False) -> int:
+    """Get the size in bytes of one element of the given dtype, cached so the
+    probe tensor is only allocated once per dtype."""
+    if is_quantized:
+        return torch._empty_affine_quantized([], dtype=dtype).element_size()
+    return torch.tensor([], dtype=dtype).element_size()
+
+
 @compatibility(is_backward_compatible=True)
 def activation_size(out: Union[torch.Tensor, Dict, List, Tuple, int]) -> int:
     """Calculate activation size of a node.
@@ -20,10 +30,7 @@ def activation_size(out: Union[torch.Tensor, Dict, List, Tuple, int]) -> int:
     """
     act_size = 0
     if isinstance(out, torch.Tensor):
-        if out.is_quantized:
-            act_size += out.numel() * torch._empty_affine_quantized([], dtype=out.dtype).element_size()
-        else:
-            act_size += out.numel() * torch.tensor([], dtype=out.dtype).element_size()
+        act_size += out.numel() * _element_size(out.dtype, out.is_quantized)
     elif isinstance(out, dict):
         value_list = [v for _, v in out.items()]
         act_size += activation_size(value_list)
@@ -45,7 +52,7 @@ def parameter_size(mod: torch.nn.Module) -> int:
     """
     param_size = 0
     for param in mod.parameters():
-        param_size += param.numel() * torch.tensor([], dtype=param.dtype).element_size()
+        param_size += param.numel() * _element_size(param.dtype)
     return param_size
 
 
@@ -50,6 +50,9 @@ class ShapeConsistencyManager(metaclass=SingletonMeta):
         self.total_communication_cost = 0
         self.total_transform_steps = 0
         self.cached_spec_pairs_transform_path = {}
+        # cache the full result of shape_consistency so that repeated (source, target)
+        # pairs during strategy building are answered without re-running the search
+        self.cached_shape_consistency_results = {}
 
     @property
     def options(self):
@@ -630,11 +633,24 @@ class ShapeConsistencyManager(metaclass=SingletonMeta):
         transform_path = []
         comm_action_sequence = []
         spec_pairs = (str(source_spec.sharding_sequence), str(target_spec.sharding_sequence))
+
+        # the transform path only depends on the device mesh, the tensor shape and the
+        # source/target sharding sequences, so solved pairs are answered from cache
+        result_cache_key = (tuple(source_spec.device_mesh.mesh_shape), tuple(source_spec.entire_shape), *spec_pairs)
+        cached_result = self.cached_shape_consistency_results.get(result_cache_key, None)
+        if cached_result is not None:
+            transform_path, comm_action_sequence, cached_cost_dict = cached_result
+            self.cached_spec_pairs_transform_path[spec_pairs] = (transform_path, comm_action_sequence)
+            # return a copy of the cost dict as callers may accumulate into it
+            return (transform_path, comm_action_sequence, dict(cached_cost_dict))
+
         self.cached_spec_pairs_transform_path[spec_pairs] = (None, None)
 
         # We do nothing if the sharding spec is all the same.
         if source_spec.sharding_sequence_difference(target_spec) == 0:
             self.cached_spec_pairs_transform_path[spec_pairs] = (transform_path, comm_action_sequence)
+            self.cached_shape_consistency_results[result_cache_key] = (transform_path, comm_action_sequence,
+                                                                       dict(total_cost_dict))
             return (transform_path, comm_action_sequence, total_cost_dict)
 
         temp_sharding_spec = source_spec
@@ -655,6 +671,8 @@ class ShapeConsistencyManager(metaclass=SingletonMeta):
                     transform_path.append(sharding_spec)
                     comm_action_sequence.append(comm_spec)
                     self.cached_spec_pairs_transform_path[spec_pairs] = (transform_path, comm_action_sequence)
+                    self.cached_shape_consistency_results[result_cache_key] = (transform_path, comm_action_sequence,
+                                                                               dict(total_cost_dict))
                     return (transform_path, comm_action_sequence, total_cost_dict)
 
                 if spec_difference < best_difference_score:
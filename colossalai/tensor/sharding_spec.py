@@ -27,21 +27,25 @@ class _DimSpec:
             Otherwise, the element in shard_list means the data will be sharded in that dimension.
     '''
 
+    # the difference mapping is identical for every instance, so it is built once
+    # lazily and shared on the class
+    _difference_dict = None
+
     def __init__(self, shard_list):
         self.is_replica = len(shard_list) == 0
         self.shard_list = shard_list
+        # the str repr is requested for every comparison, so it is computed once
+        if self.is_replica:
+            self._repr = 'R'
+        else:
+            self._repr = 'S' + ''.join(str(dim) for dim in self.shard_list)
         self.build_difference_2d_dict()
 
     def __eq__(self, other):
-        return str(self) == str(other)
+        return self._repr == str(other)
 
     def __repr__(self):
-        if self.is_replica:
-            return 'R'
-        target = 'S'
-        for dim in self.shard_list:
-            target += str(dim)
-        return target
+        return self._repr
 
     def _convert_str_to_shard_list(self, str_spec):
         '''
@@ -65,6 +69,9 @@ class _DimSpec:
         Build a difference maping for 2D device mesh case. It will be used to
         compute the difference between DimSpec pairs.
         '''
+        if _DimSpec._difference_dict is not None:
+            self.difference_dict = _DimSpec._difference_dict
+            return
 
         source_spec_list = ['R', 'S0', 'S1', 'S01']
         target_spec_list = ['R', 'S0', 'S1', 'S01']
@@ -116,6 +123,7 @@ class _DimSpec:
                     difference = NAN
                 difference_dict[spec_pair] = difference
 
+        _DimSpec._difference_dict = difference_dict
         self.difference_dict = difference_dict
 
     def difference(self, other):
@@ -136,7 +144,7 @@ class _DimSpec:
         Output:
             5
         '''
-        difference = self.difference_dict[(str(self), str(other))]
+        difference = self.difference_dict[(self._repr, str(other))]
         return difference
 
 